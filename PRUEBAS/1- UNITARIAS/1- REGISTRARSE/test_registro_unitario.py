@@ -1,7 +1,11 @@
 import requests  # Importa la librería para hacer solicitudes HTTP.
 import unittest  # Importa la librería para realizar pruebas unitarias.
 from bs4 import BeautifulSoup  # Importa BeautifulSoup para parsear y manipular HTML.
-import random  # Importa la librería random para generar datos aleatorios en las pruebas.
+import os  # Importa os para construir la ruta del paquete de utilidades.
+import sys  # Importa sys para agregar PRUEBAS/ a las rutas de importación.
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))  # Permite importar 'utilidades'.
+from utilidades.datos_prueba import FabricaUsuarios  # Importa la fábrica de usuarios de prueba únicos.
 
 # URL base del formulario de registro de usuarios
 BASE_URL = "https://biblioteca-cubo.com/Biblioteca-CUBO/public/user/registerUser"
@@ -13,6 +17,8 @@ class TestRegistroBiblioteca(unittest.TestCase):
     def setUpClass(cls):
         # Método de configuración que se ejecuta una vez antes de todas las pruebas.
         cls.session = requests.Session()  # Crea una nueva sesión para mantener las cookies entre solicitudes.
+        cls.fabrica = FabricaUsuarios(prefijo="usuario_test")  # Genera correos y usernames sin colisiones.
+        cls.fabrica_fail = FabricaUsuarios(prefijo="fail")  # Usuarios para los casos de error de validación.
         print("\n=== INICIANDO PRUEBAS DE REGISTRO===\n")
 
     def get_csrf_token(self):
@@ -33,7 +39,7 @@ class TestRegistroBiblioteca(unittest.TestCase):
         token = self.get_csrf_token()  # Obtener el token CSRF antes de enviar el formulario.
         self.assertIsNotNone(token, "No se encontró el token CSRF.")  # Verificar que se obtuvo el token CSRF.
 
-        correo_prueba = f"usuario_test_{random.randint(1000,9999)}@example.com"  # Crear un correo aleatorio para este registro de prueba.
+        usuario = self.fabrica.siguiente()  # Generar un usuario único para este registro de prueba.
 
         # Crear el payload del formulario con los datos de prueba.
         payload = {
@@ -41,8 +47,8 @@ class TestRegistroBiblioteca(unittest.TestCase):
             "nombre": "Jesse Miranda",  # Nombre del usuario.
             "edad": "24",               # Edad del usuario.
             "sexo": "Masculino",        # Sexo del usuario.
-            "correo": correo_prueba,    # Correo electrónico generado aleatoriamente.
-            "username": f"jesmir{random.randint(100,999)}",  # Nombre de usuario único.
+            "correo": usuario["correo"],      # Correo electrónico único de la fábrica.
+            "username": usuario["username"],  # Nombre de usuario único.
             "telefono": "79356730",     # Teléfono del usuario.
             "direccion": "Barrio La Cruz, Calle Principal",  # Dirección del usuario.
             "password": "12345678",     # Contraseña.
@@ -72,14 +78,16 @@ class TestRegistroBiblioteca(unittest.TestCase):
         # Prueba unitaria para verificar el error de validación cuando las contraseñas no coinciden.
         token = self.get_csrf_token()  # Obtener el token CSRF para este caso.
 
+        usuario = self.fabrica_fail.siguiente()  # Generar un usuario único para este caso.
+
         # Crear un payload con contraseñas que no coinciden.
         payload = {
             "_token": token,
             "nombre": "Error Contraseña",  # Nombre del usuario con error.
             "edad": "22",                  # Edad.
             "sexo": "Femenino",            # Sexo.
-            "correo": f"fail_{random.randint(1000,9999)}@example.com",  # Correo de prueba.
-            "username": f"userfail{random.randint(100,999)}",  # Nombre de usuario único.
+            "correo": usuario["correo"],   # Correo de prueba único.
+            "username": usuario["username"],  # Nombre de usuario único.
             "telefono": "70001111",        # Teléfono.
             "direccion": "San Miguel",     # Dirección.
             "password": "12345678",        # Contraseña.
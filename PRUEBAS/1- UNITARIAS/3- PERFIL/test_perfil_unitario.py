@@ -1,6 +1,11 @@
 import requests  # Importa la librería para hacer solicitudes HTTP.
 import unittest  # Importa la librería para realizar pruebas unitarias.
 from bs4 import BeautifulSoup  # Importa BeautifulSoup para parsear y manipular HTML.
+import os  # Importa os para construir la ruta del paquete de utilidades.
+import sys  # Importa sys para agregar PRUEBAS/ a las rutas de importación.
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))  # Permite importar 'utilidades'.
+from utilidades.cache_resultados import CacheResultados  # Caché del modo incremental.
 
 # URL base del formulario de inicio de sesión y la página de perfil
 LOGIN_URL = "https://biblioteca-cubo.com/Biblioteca-CUBO/public/user/loginUser"
@@ -15,6 +20,7 @@ class TestPerfilBiblioteca(unittest.TestCase):
         cls.session = requests.Session()  # Crea una nueva sesión para mantener las cookies entre solicitudes.
         cls.email = "mp20049@ues.edu.sv"  # Email del usuario para login.
         cls.password = "12345678"  # Contraseña del usuario para login.
+        cls.cache = CacheResultados("perfil")  # Reutiliza resultados si la página no cambió (MODO_INCREMENTAL=1).
         print("\n=== INICIANDO PRUEBAS DE PERFIL ===\n")
 
         # Iniciar sesión antes de ejecutar las pruebas.
@@ -44,14 +50,17 @@ class TestPerfilBiblioteca(unittest.TestCase):
         print("Status:", r.status_code)
         print("URL:", r.url)
 
-        # Verifica que la respuesta sea 200 (OK).
-        self.assertEqual(r.status_code, 200)
+        def verificar(r):
+            # Verifica que la respuesta sea 200 (OK).
+            self.assertEqual(r.status_code, 200)
 
-        # Verifica que los datos del perfil se muestren correctamente en la página.
-        self.assertTrue(
-            all(x in r.text.lower() for x in ["jesse miranda", "mp20049@ues.edu.sv", "guardar cambios"]),
-            "No se encontraron los datos esperados en la vista de perfil."
-        )
+            # Verifica que los datos del perfil se muestren correctamente en la página.
+            self.assertTrue(
+                all(x in r.text.lower() for x in ["jesse miranda", "mp20049@ues.edu.sv", "guardar cambios"]),
+                "No se encontraron los datos esperados en la vista de perfil."
+            )
+
+        self.cache.verificar(self, r, verificar)  # Ejecuta (o reutiliza) las verificaciones.
 
     # ----------------------------------------------------------
     # Caso 2: Actualización válida de datos
@@ -130,6 +139,7 @@ class TestPerfilBiblioteca(unittest.TestCase):
     @classmethod
     def tearDownClass(cls):
         # Método de limpieza que se ejecuta una vez después de todas las pruebas.
+        cls.cache.guardar()  # Guarda la caché y muestra cuánto trabajo se omitió.
         print("\n\n=== PRUEBAS DE PERFIL FINALIZADAS ===\n")
 
 # Ejecuta las pruebas cuando el script es ejecutado directamente.
@@ -1,6 +1,11 @@
 import requests  # Importa la librería para hacer solicitudes HTTP.
 import unittest  # Importa la librería para realizar pruebas unitarias.
 from bs4 import BeautifulSoup  # Importa BeautifulSoup para parsear y manipular HTML.
+import os  # Importa os para construir la ruta del paquete de utilidades.
+import sys  # Importa sys para agregar PRUEBAS/ a las rutas de importación.
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))  # Permite importar 'utilidades'.
+from utilidades.cache_resultados import CacheResultados  # Caché del modo incremental.
 
 # URL base del formulario de inicio de sesión y la página de lectura de libros
 LOGIN_URL = "https://biblioteca-cubo.com/Biblioteca-CUBO/public/user/loginUser"
@@ -15,6 +20,7 @@ class TestLeerLibroBiblioteca(unittest.TestCase):
         cls.session = requests.Session()  # Crea una nueva sesión para mantener las cookies entre solicitudes.
         cls.email = "mp20049@ues.edu.sv"  # Email del usuario para login.
         cls.password = "12345678"  # Contraseña del usuario para login.
+        cls.cache = CacheResultados("leer_libro")  # Reutiliza resultados si la página no cambió (MODO_INCREMENTAL=1).
         print("\n=== INICIANDO PRUEBAS DE LEER LIBRO ===\n")
 
         # Iniciar sesión antes de ejecutar las pruebas.
@@ -44,14 +50,17 @@ class TestLeerLibroBiblioteca(unittest.TestCase):
         print("Status:", r.status_code)
         print("URL:", r.url)
 
-        # Verifica que la respuesta sea 200 (OK).
-        self.assertEqual(r.status_code, 200)
+        def verificar(r):
+            # Verifica que la respuesta sea 200 (OK).
+            self.assertEqual(r.status_code, 200)
+
+            # Verifica que el contenido de la página cargue correctamente (buscando texto relacionado con el libro).
+            self.assertTrue(
+                all(k in r.text.lower() for k in ["el principito", "capítulo", "página siguiente"]),
+                "No se cargó correctamente el contenido del libro."
+            )
 
-        # Verifica que el contenido de la página cargue correctamente (buscando texto relacionado con el libro).
-        self.assertTrue(
-            all(k in r.text.lower() for k in ["el principito", "capítulo", "página siguiente"]),
-            "No se cargó correctamente el contenido del libro."
-        )
+        self.cache.verificar(self, r, verificar)  # Ejecuta (o reutiliza) las verificaciones.
 
     # ----------------------------------------------------------
     # Caso 2: Verificar navegación (botones de lectura)
@@ -59,16 +68,20 @@ class TestLeerLibroBiblioteca(unittest.TestCase):
     def test_elementos_de_navegacion(self):
         # Verifica que los botones de navegación estén presentes y funcionen correctamente.
         r = self.session.get(LEER_URL)  # Realiza una solicitud GET para la página del libro.
-        soup = BeautifulSoup(r.text, "html.parser")  # Analiza el HTML de la página.
 
-        # Extrae los textos de los botones de la página.
-        botones = [b.get_text(strip=True).lower() for b in soup.find_all("button")]
-        print("\n[Elementos de navegación encontrados]:", botones)
+        def verificar(r):
+            soup = BeautifulSoup(r.text, "html.parser")  # Analiza el HTML de la página.
 
-        # Verifica que los botones de navegación (siguiente, anterior, índice, etc.) estén presentes.
-        self.assertTrue(any("página siguiente" in b for b in botones))
-        self.assertTrue(any("página anterior" in b for b in botones))
-        self.assertTrue(any("índice" in b or "justificar" in b or "noche" in b for b in botones))
+            # Extrae los textos de los botones de la página.
+            botones = [b.get_text(strip=True).lower() for b in soup.find_all("button")]
+            print("\n[Elementos de navegación encontrados]:", botones)
+
+            # Verifica que los botones de navegación (siguiente, anterior, índice, etc.) estén presentes.
+            self.assertTrue(any("página siguiente" in b for b in botones))
+            self.assertTrue(any("página anterior" in b for b in botones))
+            self.assertTrue(any("índice" in b or "justificar" in b or "noche" in b for b in botones))
+
+        self.cache.verificar(self, r, verificar)  # Ejecuta (o reutiliza) las verificaciones.
 
     # ----------------------------------------------------------
     # Caso 3: Error – libro inexistente
@@ -80,18 +93,22 @@ class TestLeerLibroBiblioteca(unittest.TestCase):
         print("\n[Libro inexistente]")
         print("Status:", r.status_code)
 
-        # Verifica que el código de estado sea 404 (Not Found) o 200 en algunos casos.
-        self.assertIn(r.status_code, [200, 404])
+        def verificar(r):
+            # Verifica que el código de estado sea 404 (Not Found) o 200 en algunos casos.
+            self.assertIn(r.status_code, [200, 404])
+
+            # Verifica que la respuesta contenga un mensaje de error indicando que el libro no fue encontrado.
+            self.assertTrue(
+                any(k in r.text.lower() for k in ["error", "no encontrado", "libro"]),
+                "El sistema no mostró mensaje de error ante libro inexistente."
+            )
 
-        # Verifica que la respuesta contenga un mensaje de error indicando que el libro no fue encontrado.
-        self.assertTrue(
-            any(k in r.text.lower() for k in ["error", "no encontrado", "libro"]),
-            "El sistema no mostró mensaje de error ante libro inexistente."
-        )
+        self.cache.verificar(self, r, verificar)  # Ejecuta (o reutiliza) las verificaciones.
 
     @classmethod
     def tearDownClass(cls):
         # Método de limpieza que se ejecuta una vez después de todas las pruebas.
+        cls.cache.guardar()  # Guarda la caché y muestra cuánto trabajo se omitió.
         print("\n\n=== PRUEBAS DE LEER LIBRO FINALIZADAS ===\n")
 
 # Ejecuta las pruebas cuando el script es ejecutado directamente.
@@ -1,8 +1,13 @@
 import requests  # Importa la librería para hacer solicitudes HTTP.
 import unittest  # Importa la librería para realizar pruebas unitarias.
 from bs4 import BeautifulSoup  # Importa BeautifulSoup para parsear y manipular HTML.
-import random  # Importa la librería random para generar datos aleatorios en las pruebas.
-import unicodedata  # Importa unicodedata para normalizar y eliminar tildes.
+import os  # Importa os para construir la ruta del paquete de utilidades.
+import sys  # Importa sys para agregar PRUEBAS/ a las rutas de importación.
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))  # Permite importar 'utilidades'.
+from utilidades.datos_prueba import FabricaUsuarios  # Importa la fábrica de usuarios de prueba únicos.
+from utilidades.huellas_paginas import IndiceHuellas, simhash  # Huellas estructurales de las páginas.
+from utilidades.texto import limpiar_texto  # Normalización de texto compartida.
 
 # URLs base para el registro, login, perfil y lectura de libros
 BASE = "https://biblioteca-cubo.com/Biblioteca-CUBO/public"
@@ -18,8 +23,11 @@ class TestIntegracionBiblioteca(unittest.TestCase):
     def setUpClass(cls):
         # Configuración inicial que se ejecuta una vez antes de todas las pruebas.
         cls.session = requests.Session()  # Crea una nueva sesión para mantener las cookies entre solicitudes.
-        cls.user_email = f"integracion_{random.randint(1000,9999)}@example.com"  # Email del usuario de prueba.
+        cls.usuario = FabricaUsuarios(prefijo="integracion").siguiente()  # Usuario de prueba único de esta ejecución.
+        cls.user_email = cls.usuario["correo"]  # Email del usuario de prueba.
         cls.user_pass = "12345678"  # Contraseña del usuario de prueba.
+        cls.huellas = IndiceHuellas()  # Huellas de las páginas de esta ejecución.
+        cls.huellas_anteriores = IndiceHuellas.cargar_anterior("integracion")  # Huellas de la ejecución anterior.
         print("\n=== INICIANDO PRUEBAS DE INTEGRACION DE SISTEMA WEB BIBLIOTECA VIRTUAL CUBO ===\n")
 
     # --------------------------------------------------------------
@@ -36,11 +44,8 @@ class TestIntegracionBiblioteca(unittest.TestCase):
     # Normaliza texto (minúsculas + sin tildes)
     # --------------------------------------------------------------
     def limpiar_texto(self, texto):
-        # Normaliza el texto a minúsculas y elimina las tildes.
-        texto = texto.lower()
-        texto = ''.join(c for c in unicodedata.normalize('NFD', texto)
-                        if unicodedata.category(c) != 'Mn')  # Elimina las marcas de acento (tildes).
-        return texto
+        # Normaliza el texto a minúsculas y elimina las tildes (utilidad compartida).
+        return limpiar_texto(texto)
 
     # --------------------------------------------------------------
     # Paso 1: Registro
@@ -54,7 +59,7 @@ class TestIntegracionBiblioteca(unittest.TestCase):
             "edad": "24",  # Edad del usuario.
             "sexo": "Masculino",  # Sexo del usuario.
             "correo": self.user_email,  # Correo electrónico del usuario.
-            "username": f"userint{random.randint(100,999)}",  # Nombre de usuario único.
+            "username": self.usuario["username"],  # Nombre de usuario único.
             "telefono": "70001111",  # Teléfono del usuario.
             "direccion": "San Miguel",  # Dirección del usuario.
             "password": self.user_pass,  # Contraseña del usuario.
@@ -62,6 +67,7 @@ class TestIntegracionBiblioteca(unittest.TestCase):
         }
         r = self.session.post(REGISTER_URL, data=payload, allow_redirects=True)  # Envía los datos del formulario.
         texto = self.limpiar_texto(r.text)  # Normaliza el texto de la respuesta.
+        self.huellas.agregar("registro", simhash(r.text))  # Huella estructural de la respuesta del registro.
 
         print("\n[Registro de usuario]")
         print("Status:", r.status_code)
@@ -87,6 +93,7 @@ class TestIntegracionBiblioteca(unittest.TestCase):
         }
         r = self.session.post(LOGIN_URL, data=payload, allow_redirects=True)  # Envía los datos del formulario.
         texto = self.limpiar_texto(r.text)  # Normaliza el texto de la respuesta.
+        self.huellas.agregar("login", simhash(r.text))  # Huella estructural de la respuesta del login.
 
         print("\n[Inicio de sesión]")
         print("Status:", r.status_code)
@@ -108,19 +115,16 @@ class TestIntegracionBiblioteca(unittest.TestCase):
         soup = BeautifulSoup(r.text, "html.parser")  # Analiza el HTML de la página.
 
         # Obtiene el texto completo de la página y lo normaliza.
-        texto_completo = soup.get_text(" ", strip=True).lower()
-        texto_completo = ''.join(c for c in unicodedata.normalize('NFD', texto_completo)
-                                 if unicodedata.category(c) != 'Mn')
+        texto_completo = self.limpiar_texto(soup.get_text(" ", strip=True))
 
         # Obtiene los valores de los inputs y botones.
         valores_inputs = [i.get('placeholder', '') for i in soup.find_all('input')]
         valores_inputs += [i.get('value', '') for i in soup.find_all('input')]
         valores_inputs += [b.get_text(strip=True) for b in soup.find_all('button')]
-        texto_extra = ' '.join(valores_inputs).lower()
-        texto_extra = ''.join(c for c in unicodedata.normalize('NFD', texto_extra)
-                              if unicodedata.category(c) != 'Mn')
+        texto_extra = self.limpiar_texto(' '.join(valores_inputs))
 
         texto = texto_completo + " " + texto_extra  # Junta el texto completo.
+        self.huellas.agregar("perfil", simhash(r.text))  # Huella estructural del perfil.
 
         print("\n[Acceso al perfil]")
         print("Status:", r.status_code)
@@ -149,6 +153,7 @@ class TestIntegracionBiblioteca(unittest.TestCase):
         # Verifica que el lector de libros cargue correctamente.
         r = self.session.get(LEER_URL)  # Realiza una solicitud GET a la página de lectura del libro.
         texto = self.limpiar_texto(r.text)  # Normaliza el texto de la respuesta.
+        self.huellas.agregar("lector", simhash(r.text))  # Huella estructural del lector.
 
         print("\n[Lector de libro]")
         print("Status:", r.status_code)
@@ -180,6 +185,11 @@ class TestIntegracionBiblioteca(unittest.TestCase):
     @classmethod
     def tearDownClass(cls):
         # Método de limpieza que se ejecuta una vez después de todas las pruebas.
+        # Compara la estructura de las páginas con la ejecución anterior y guarda las huellas.
+        for pagina, distancia in cls.huellas.cambios(cls.huellas_anteriores).items():
+            print(f"Advertencia: la estructura de '{pagina}' cambió respecto de la ejecución anterior "
+                  f"({distancia} bits de diferencia).")
+        cls.huellas.guardar("integracion")
         print("\n\n=== PRUEBAS DE INTEGRACION DE SISTEMA WEB BIBLIOTECA VIRTUAL CUBO FINALIZADAS ===\n")
 
 # Ejecuta las pruebas cuando el script es ejecutado directamente.
@@ -3,6 +3,18 @@ import time  # Importa la librería para medir el tiempo de ejecución.
 from selenium import webdriver  # Importa Selenium para controlar el navegador.
 from selenium.webdriver.common.by import By  # Importa la clase para buscar elementos por su localización.
 from selenium.webdriver.chrome.options import Options  # Importa las opciones para configurar el navegador.
+from selenium.webdriver.support.ui import WebDriverWait  # Importa la espera explícita.
+from selenium.webdriver.support import expected_conditions as EC  # Importa las condiciones de espera.
+import os  # Importa os para construir la ruta del paquete de utilidades.
+import sys  # Importa sys para agregar PRUEBAS/ a las rutas de importación.
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))  # Permite importar 'utilidades'.
+from utilidades.perfilador_render import activar_perfilador, metricas_rendimiento, perfilar_pagina, INTERACCIONES_LECTOR  # Perfilador DOM/render.
+
+# Modo filmstrip: captura la carga de cada página y calcula Speed Index (MODO_FILMSTRIP=1, requiere numpy y Pillow).
+MODO_FILMSTRIP = os.environ.get("MODO_FILMSTRIP") == "1"
+if MODO_FILMSTRIP:
+    from utilidades.filmstrip import capturar_filmstrip, analizar_filmstrip
 
 class TestUsabilidadBiblioteca(unittest.TestCase):
     # Prueba de usabilidad del sistema Biblioteca CUBO (Cuadrante 3 – Usabilidad).
@@ -14,19 +26,42 @@ class TestUsabilidadBiblioteca(unittest.TestCase):
         options.add_argument("--headless=new")  # Ejecuta el navegador sin interfaz gráfica.
         options.add_argument("--disable-gpu")  # Desactiva la aceleración de GPU (opcional).
         options.add_argument("--window-size=1920,1080")  # Establece el tamaño de la ventana del navegador.
+        if MODO_FILMSTRIP:
+            # Sin esta estrategia, ChromeDriver bloquea capturas y scripts hasta el fin de la carga.
+            options.page_load_strategy = "none"
 
         # Inicializa el controlador de Selenium con las opciones definidas.
         cls.driver = webdriver.Chrome(options=options)
         cls.driver.implicitly_wait(10)  # Espera implícita de 10 segundos para encontrar los elementos.
         cls.base = "https://biblioteca-cubo.com/Biblioteca-CUBO/public"  # URL base del sistema.
+        activar_perfilador(cls.driver)  # Activa las métricas de DevTools (DOM, layouts, tareas largas).
 
         print("\n=== INICIANDO PRUEBAS DE USABILIDAD DE SISTEMA WEB BIBLIOTECA VIRTUAL CUBO ===\n")
 
+    # ---------------------------------------------------------------
+    # Utilidad: esperar a que termine la carga del documento actual
+    # ---------------------------------------------------------------
+    def esperar_carga(self):
+        # Con la estrategia de carga normal, driver.get ya espera; en modo filmstrip ("none") no.
+        WebDriverWait(self.driver, 30).until(
+            lambda d: d.execute_script("return document.readyState;") == "complete")
+
     # ---------------------------------------------------------------
     # Utilidad: medir tiempo de carga
     # ---------------------------------------------------------------
-    def medir_tiempo_carga(self, url):
+    def medir_tiempo_carga(self, url, nombre=None):
         # Mide el tiempo de carga de una página.
+        # Métricas de DevTools antes de navegar, para que el perfil guarde solo las de esta página.
+        self.metricas_antes = metricas_rendimiento(self.driver)
+        if MODO_FILMSTRIP and nombre:
+            # En modo filmstrip se captura la carga; el tiempo es el de carga completa del documento
+            # según Navigation Timing, para que las capturas no alteren las verificaciones de tiempo.
+            cuadros, tiempo_carga = capturar_filmstrip(self.driver, url)
+            resultado = analizar_filmstrip(nombre, cuadros, tiempo_carga)
+            print(f"[Filmstrip – {nombre}] Speed Index: {resultado['speed_index']} | "
+                  f"Visualmente completo: {resultado['visualmente_completo_ms']} ms | Cuadros: {len(cuadros)}")
+            return round(tiempo_carga, 2)
+
         inicio = time.time()  # Marca el inicio del tiempo.
         self.driver.get(url)  # Carga la URL.
         fin = time.time()  # Marca el final del tiempo.
@@ -38,7 +73,7 @@ class TestUsabilidadBiblioteca(unittest.TestCase):
     def test_1_usabilidad_registro(self):
         # Verifica la usabilidad de la página de registro.
         url = f"{self.base}/user/registerUser"  # URL de la página de registro.
-        tiempo = self.medir_tiempo_carga(url)  # Mide el tiempo de carga de la página.
+        tiempo = self.medir_tiempo_carga(url, "registro")  # Mide el tiempo de carga de la página.
         print(f"\n[Usabilidad – Registro]\nTiempo de carga: {tiempo}s")
 
         # Lista de campos que deben aparecer en la página de registro.
@@ -61,7 +96,7 @@ class TestUsabilidadBiblioteca(unittest.TestCase):
     def test_2_usabilidad_login(self):
         # Verifica la usabilidad de la página de login.
         url = f"{self.base}/user/loginUser"  # URL de la página de login.
-        tiempo = self.medir_tiempo_carga(url)  # Mide el tiempo de carga de la página.
+        tiempo = self.medir_tiempo_carga(url, "login")  # Mide el tiempo de carga de la página.
         print(f"\n[Usabilidad – Login]\nTiempo de carga: {tiempo}s")
 
         # Verifica que los campos de email y password estén presentes.
@@ -85,15 +120,18 @@ class TestUsabilidadBiblioteca(unittest.TestCase):
     def test_3_usabilidad_perfil(self):
         # Inicia sesión con un usuario previamente registrado.
         self.driver.get(f"{self.base}/user/loginUser")
+        self.esperar_carga()
         self.driver.find_element(By.NAME, "email").send_keys("mp20049@ues.edu.sv")
         self.driver.find_element(By.NAME, "password").send_keys("12345678")
-        self.driver.find_element(By.CLASS_NAME, "login-btn").click()
+        boton = self.driver.find_element(By.CLASS_NAME, "login-btn")
+        boton.click()
+
+        # Espera la respuesta del login antes de navegar al perfil (en modo filmstrip el clic no espera).
+        WebDriverWait(self.driver, 30).until(EC.staleness_of(boton))
+        self.esperar_carga()
 
         # Mide el tiempo de carga de la página del perfil.
-        inicio = time.time()
-        self.driver.get(f"{self.base}/perfil")
-        fin = time.time()
-        tiempo = round(fin - inicio, 2)
+        tiempo = self.medir_tiempo_carga(f"{self.base}/perfil", "perfil")
         print(f"\n[Usabilidad – Perfil]\nTiempo de carga: {tiempo}s")
 
         # Obtiene el texto de la página y lo normaliza (sin tildes y en minúsculas).
@@ -106,6 +144,11 @@ class TestUsabilidadBiblioteca(unittest.TestCase):
         encontrados = [txt for txt in elementos_visibles if txt in page_text]
         print("Elementos detectados:", encontrados)
 
+        # Perfila la complejidad del DOM y el costo de render del perfil.
+        perfil = perfilar_pagina(self.driver, "perfil", metricas_inicio=self.metricas_antes)
+        print(f"Nodos DOM: {perfil['nodos_dom']} | Profundidad: {perfil['profundidad_maxima']} | "
+              f"Tareas largas: {perfil['tiempo_tareas_largas_ms']} ms")
+
         # Verifica que el título de la página sea el esperado.
         self.assertIn(
             self.driver.title.lower(),
@@ -125,10 +168,7 @@ class TestUsabilidadBiblioteca(unittest.TestCase):
     def test_4_usabilidad_leer(self):
         # Verifica la usabilidad de la página del lector de libros.
         url = f"{self.base}/libros/EP02025/leer"  # URL del libro.
-        inicio = time.time()
-        self.driver.get(url)  # Carga la página del libro.
-        fin = time.time()
-        tiempo = round(fin - inicio, 2)
+        tiempo = self.medir_tiempo_carga(url, "lector")  # Carga la página del libro.
         print(f"\n[Usabilidad – Lector de Libros]\nTiempo de carga: {tiempo}s")
 
         # Obtiene el texto de la página y lo normaliza (sin tildes y en minúsculas).
@@ -139,6 +179,14 @@ class TestUsabilidadBiblioteca(unittest.TestCase):
         encontrados = [b for b in botones if b in page_text]
         print("Botones detectados:", encontrados)
 
+        # Perfila el lector y mide sus interacciones (página siguiente, modo noche, justificar, índice).
+        perfil = perfilar_pagina(self.driver, "lector_EP02025", INTERACCIONES_LECTOR, self.metricas_antes)
+        print(f"Nodos DOM: {perfil['nodos_dom']} | Profundidad: {perfil['profundidad_maxima']} | "
+              f"Tareas largas: {perfil['tiempo_tareas_largas_ms']} ms")
+        for accion, datos in perfil["interacciones"].items():
+            print(f"Interacción '{accion}': {datos['tiempo_ms']} ms, {datos['layouts']} layouts, "
+                  f"{datos['recalculos_estilo']} recálculos de estilo")
+
         # Verifica que el contenido del libro cargue correctamente.
         self.assertTrue(
             any(k in page_text for k in ["el principito", "capítulo", "lector"]),
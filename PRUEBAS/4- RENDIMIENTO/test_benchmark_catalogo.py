@@ -0,0 +1,211 @@
+import requests  # Importa la librería para hacer solicitudes HTTP.
+import unittest  # Importa la librería para realizar pruebas unitarias.
+from bs4 import BeautifulSoup  # Importa BeautifulSoup para parsear y manipular HTML.
+import threading  # Importa threading para tener una sesión por hilo.
+import itertools  # Importa itertools para enviar los libros al pool en lotes.
+import statistics  # Importa statistics para calcular percentiles.
+import time  # Importa time para medir la latencia de cada libro.
+import json  # Importa json para guardar el índice, los resultados y el reporte.
+import re  # Importa re para extraer el ID de libro de los enlaces.
+import os  # Importa os para leer variables de entorno y construir rutas.
+import sys  # Importa sys para agregar PRUEBAS/ a las rutas de importación.
+from urllib.parse import urljoin  # Importa urljoin para resolver enlaces relativos del catálogo.
+from concurrent.futures import ThreadPoolExecutor  # Importa el pool de hilos acotado.
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))  # Permite importar 'utilidades'.
+from utilidades.ejecucion import ID_EJECUCION, carpeta_resultados, reparar_jsonl  # Datos de la ejecución.
+from utilidades.sesion import BASE, iniciar_sesion  # Login compartido.
+from utilidades.huellas_paginas import IndiceHuellas, simhash  # Huellas estructurales de las páginas.
+from utilidades.texto import limpiar_texto  # Normalización de texto compartida.
+
+# Página del catálogo desde la que se descubren los libros (se puede cambiar con CATALOGO_URL).
+CATALOGO_URL = os.environ.get("CATALOGO_URL", f"{BASE}/libros")
+
+# Número de solicitudes simultáneas al lector.
+HILOS = int(os.environ.get("HILOS_BENCHMARK", "8"))
+
+# Tiempo máximo de espera por libro (segundos).
+TIMEOUT = int(os.environ.get("TIMEOUT_BENCHMARK", "30"))
+
+# El benchmark solo se ejecuta cuando se activa explícitamente (MODO_BENCHMARK=1).
+MODO_BENCHMARK = os.environ.get("MODO_BENCHMARK") == "1"
+
+# Enlaces a libros: /libros/<ID> o /libros/<ID>/leer.
+PATRON_LIBRO = re.compile(r"/libros/([A-Za-z0-9_-]+)(?:/leer)?/?$")
+
+# Palabras clave del lector (las mismas de la prueba de integración, sin tildes).
+CLAVES_LECTOR = ["capitulo", "pagina siguiente", "pagina anterior", "indice", "modo noche", "lector"]
+
+# --------------------------------------------------------------
+# Descubre los IDs de libros recorriendo el catálogo (con paginación)
+# --------------------------------------------------------------
+def descubrir_libros(session, url):
+    # Genera los IDs en orden de aparición, sin repetir, siguiendo los enlaces rel="next".
+    vistos = set()
+    visitadas = set()
+    while url and url not in visitadas:
+        visitadas.add(url)
+        soup = BeautifulSoup(session.get(url, timeout=TIMEOUT).text, "html.parser")
+        for enlace in soup.find_all("a", href=True):
+            coincidencia = PATRON_LIBRO.search(enlace["href"].split("?")[0])
+            if coincidencia and coincidencia.group(1) not in vistos:
+                vistos.add(coincidencia.group(1))
+                yield coincidencia.group(1)
+        siguiente = soup.find("a", rel="next")
+        url = urljoin(url, siguiente["href"]) if siguiente else None
+
+# --------------------------------------------------------------
+# Construye (o reutiliza) el índice de libros en disco
+# --------------------------------------------------------------
+def construir_indice(session, ruta):
+    # El índice se escribe en un temporal y se renombra al terminar, así una interrupción
+    # durante el descubrimiento no deja un índice incompleto.
+    if not os.path.exists(ruta):
+        temporal = f"{ruta}.tmp"
+        with open(temporal, "w", encoding="utf-8") as archivo:
+            for libro in descubrir_libros(session, CATALOGO_URL):
+                archivo.write(libro + "\n")
+        os.replace(temporal, ruta)
+    with open(ruta, encoding="utf-8") as archivo:
+        return [linea.strip() for linea in archivo if linea.strip()]
+
+# --------------------------------------------------------------
+# Percentiles de una lista de valores
+# --------------------------------------------------------------
+def distribucion(valores):
+    if not valores:
+        return {}
+    ordenados = sorted(valores)
+    # Método inclusivo: los percentiles quedan dentro del rango medido (el exclusivo extrapola en p99).
+    cortes = statistics.quantiles(ordenados, n=100, method="inclusive") if len(ordenados) > 1 else ordenados * 99
+    return {
+        "min": ordenados[0], "p50": cortes[49], "p90": cortes[89], "p99": cortes[98],
+        "max": ordenados[-1], "promedio": statistics.fmean(ordenados),
+    }
+
+
+@unittest.skipUnless(MODO_BENCHMARK, "Benchmark del catálogo desactivado (usar MODO_BENCHMARK=1).")
+class TestBenchmarkCatalogo(unittest.TestCase):
+    # Benchmark del lector sobre todos los libros del catálogo (Cuadrante 4 – Rendimiento).
+
+    @classmethod
+    def setUpClass(cls):
+        # Configuración inicial que se ejecuta una vez antes de todas las pruebas.
+        cls.session = requests.Session()  # Sesión para recorrer el catálogo.
+        iniciar_sesion(cls.session, timeout=TIMEOUT)
+        cls.local = threading.local()  # Cada hilo del pool tiene su propia sesión iniciada.
+        cls.carpeta = carpeta_resultados("catalogo")
+        print("\n=== INICIANDO BENCHMARK DEL CATALOGO DE LIBROS ===\n")
+        print(f"ID_EJECUCION: {ID_EJECUCION} (usar el mismo valor para reanudar)")
+
+    # ----------------------------------------------------------
+    # Utilidad: sesión del hilo actual
+    # ----------------------------------------------------------
+    def sesion_hilo(self):
+        if not hasattr(self.local, "session"):
+            session = requests.Session()
+            iniciar_sesion(session, timeout=TIMEOUT)
+            self.local.session = session  # Solo se guarda si el login funcionó; si no, el siguiente libro reintenta.
+        return self.local.session
+
+    # ----------------------------------------------------------
+    # Utilidad: fila de un libro que no se pudo medir
+    # ----------------------------------------------------------
+    def fila_error(self, libro, error, latencia_ms):
+        # El libro queda registrado como medido (con error), así una reanudación no vuelve a fallar en él.
+        return {
+            "libro": libro,
+            "status": None,
+            "error": error,
+            "latencia_ms": latencia_ms,
+            "bytes": 0,
+            "claves": [],
+        }
+
+    # ----------------------------------------------------------
+    # Utilidad: carga del lector de un libro
+    # ----------------------------------------------------------
+    def medir_libro(self, libro):
+        # La sesión del hilo se obtiene antes de iniciar el tiempo: el login no es parte de la latencia.
+        try:
+            session = self.sesion_hilo()
+        except (requests.RequestException, AssertionError) as error:
+            return self.fila_error(libro, f"login: {type(error).__name__}", None)
+        inicio = time.perf_counter()
+        try:
+            r = session.get(f"{BASE}/libros/{libro}/leer", timeout=TIMEOUT)
+        except requests.RequestException as error:
+            return self.fila_error(libro, type(error).__name__, round((time.perf_counter() - inicio) * 1000, 1))
+        latencia = time.perf_counter() - inicio
+        texto = limpiar_texto(r.text)
+        return {
+            "libro": libro,
+            "status": r.status_code,
+            "latencia_ms": round(latencia * 1000, 1),
+            "bytes": len(r.content),
+            "claves": [k for k in CLAVES_LECTOR if k in texto],
+            "huella": f"{simhash(r.text):016x}",  # Huella estructural (en lugar de guardar la página).
+        }
+
+    # ----------------------------------------------------------
+    # Caso 1: Lector de cada libro del catálogo
+    # ----------------------------------------------------------
+    def test_1_lector_todo_el_catalogo(self):
+        libros = construir_indice(self.session, os.path.join(self.carpeta, "indice_libros.txt"))
+        print(f"Libros en el índice: {len(libros)}")
+        self.assertTrue(libros, f"No se encontraron libros en el catálogo ({CATALOGO_URL}).")
+
+        # Los resultados se agregan línea por línea; al reanudar (mismo ID_EJECUCION) se omiten los ya medidos.
+        ruta_resultados = os.path.join(self.carpeta, "resultados.jsonl")
+        resultados = []
+        if reparar_jsonl(ruta_resultados):  # Recorta una última línea incompleta si la corrida se interrumpió.
+            with open(ruta_resultados, encoding="utf-8") as archivo:
+                resultados = [json.loads(linea) for linea in archivo if linea.strip()]
+        medidos = {fila["libro"] for fila in resultados}
+        pendientes = iter([libro for libro in libros if libro not in medidos])
+        print(f"Ya medidos: {len(medidos)} | Pendientes: {len(libros) - len(medidos)}")
+
+        with open(ruta_resultados, "a", encoding="utf-8") as archivo, ThreadPoolExecutor(max_workers=HILOS) as ejecutor:
+            while True:
+                lote = list(itertools.islice(pendientes, HILOS * 4))  # Lote acotado en memoria.
+                if not lote:
+                    break
+                for fila in ejecutor.map(self.medir_libro, lote):
+                    resultados.append(fila)
+                    archivo.write(json.dumps(fila) + "\n")
+                archivo.flush()  # Deja el progreso en disco por si la corrida se interrumpe.
+
+        # Huellas del catálogo: se comparan con la ejecución anterior para detectar cambios de estructura.
+        huellas = IndiceHuellas({f["libro"]: int(f["huella"], 16) for f in resultados if "huella" in f})
+        cambios = huellas.cambios(IndiceHuellas.cargar_anterior("catalogo"))
+        huellas.guardar("catalogo")
+        if cambios:
+            print(f"Advertencia: {len(cambios)} libros cambiaron de estructura respecto de la ejecución anterior.")
+
+        # Reporte de distribuciones de latencia y tamaño.
+        correctos = [f for f in resultados if f["status"] == 200]
+        reporte = {
+            "libros": len(resultados),
+            "latencia_ms": distribucion([f["latencia_ms"] for f in correctos]),
+            "bytes": distribucion([f["bytes"] for f in correctos]),
+            "mas_lentos": sorted(correctos, key=lambda f: f["latencia_ms"], reverse=True)[:10],
+            "estructura_cambiada": cambios,
+        }
+        with open(os.path.join(self.carpeta, "reporte.json"), "w", encoding="utf-8") as archivo:
+            json.dump(reporte, archivo, indent=2)
+        print("\n[Latencia (ms)]", {k: round(v, 1) for k, v in reporte["latencia_ms"].items()})
+        print("[Tamaño (bytes)]", {k: round(v) for k, v in reporte["bytes"].items()})
+
+        # Verifica que todos los libros carguen y muestren los controles del lector.
+        fallidos = [f["libro"] for f in resultados if f["status"] != 200 or not f["claves"]]
+        self.assertFalse(fallidos, f"Libros que no cargaron correctamente en el lector: {fallidos[:20]}")
+
+    @classmethod
+    def tearDownClass(cls):
+        # Método de limpieza que se ejecuta una vez después de todas las pruebas.
+        print(f"\nResultados guardados en: {cls.carpeta}")
+        print("\n=== BENCHMARK DEL CATALOGO DE LIBROS FINALIZADO ===\n")
+
+# Ejecuta las pruebas cuando el script es ejecutado directamente.
+if __name__ == "__main__":
+    unittest.main()
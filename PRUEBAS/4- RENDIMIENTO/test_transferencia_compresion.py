@@ -0,0 +1,156 @@
+import requests  # Importa la librería para hacer solicitudes HTTP.
+import unittest  # Importa la librería para realizar pruebas unitarias.
+import time  # Importa la librería para medir el tiempo de descarga y de decodificación.
+import gzip  # Importa gzip para decodificar respuestas comprimidas con gzip.
+import zlib  # Importa zlib para decodificar respuestas comprimidas con deflate.
+import json  # Importa json para guardar el reporte.
+import csv  # Importa csv para guardar el reporte en formato de tabla.
+import os  # Importa os para leer variables de entorno y construir rutas.
+import sys  # Importa sys para agregar PRUEBAS/ a las rutas de importación.
+
+try:
+    import brotli  # Decodificador de Brotli (opcional: pip install brotli).
+except ImportError:
+    brotli = None
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))  # Permite importar 'utilidades'.
+from utilidades.ejecucion import carpeta_resultados  # Carpeta de resultados de la ejecución actual.
+from utilidades.sesion import BASE, iniciar_sesion, iniciar_sesion_navegador  # Login compartido.
+from utilidades.navegador import crear_navegador, leer_eventos_red, peso_recursos  # DevTools (Network).
+
+# Páginas auditadas (las mismas que cubren las pruebas de los cuadrantes 1 a 3).
+PAGINAS = {
+    "registro": f"{BASE}/user/registerUser",
+    "login": f"{BASE}/user/loginUser",
+    "perfil": f"{BASE}/perfil",
+    "lector": f"{BASE}/libros/EP02025/leer",
+}
+
+# Valores de Accept-Encoding que se solicitan para cada página.
+CODIFICACIONES = ["identity", "gzip", "deflate", "br", "gzip, deflate, br"]
+
+# La auditoría solo se ejecuta cuando se activa explícitamente (MODO_AUDITORIA=1).
+MODO_AUDITORIA = os.environ.get("MODO_AUDITORIA") == "1"
+
+# --------------------------------------------------------------
+# Utilidad: decodificar el cuerpo tal como llegó por la red
+# --------------------------------------------------------------
+def decodificar(crudo, content_encoding):
+    # Retorna el cuerpo decodificado, o None si no se puede decodificar (p. ej. Brotli sin el módulo).
+    if content_encoding in ("", "identity"):
+        return crudo
+    if content_encoding == "gzip":
+        return gzip.decompress(crudo)
+    if content_encoding == "deflate":
+        try:
+            return zlib.decompress(crudo)  # Deflate con cabecera zlib.
+        except zlib.error:
+            return zlib.decompress(crudo, -zlib.MAX_WBITS)  # Deflate "crudo" (algunos servidores).
+    if content_encoding == "br" and brotli is not None:
+        return brotli.decompress(crudo)
+    return None
+
+
+@unittest.skipUnless(MODO_AUDITORIA, "Auditoría de transferencia desactivada (usar MODO_AUDITORIA=1).")
+class TestTransferenciaCompresion(unittest.TestCase):
+    # Auditoría del tamaño de transferencia y la compresión por página (Cuadrante 4 – Rendimiento).
+
+    @classmethod
+    def setUpClass(cls):
+        # Configuración inicial que se ejecuta una vez antes de todas las pruebas.
+        cls.session = requests.Session()  # Crea una nueva sesión para mantener las cookies entre solicitudes.
+        iniciar_sesion(cls.session)  # Perfil y lector requieren sesión iniciada.
+        cls.filas_red = []  # Resultados por página y Accept-Encoding.
+        cls.filas_chrome = []  # Peso de sub-recursos visto por Chrome.
+        print("\n=== INICIANDO AUDITORIA DE TRANSFERENCIA Y COMPRESION ===\n")
+
+    # ----------------------------------------------------------
+    # Utilidad: medir una descarga con un Accept-Encoding dado
+    # ----------------------------------------------------------
+    def medir_transferencia(self, url, codificacion):
+        # Se usa stream=True y decode_content=False para leer los bytes tal como vienen por la red;
+        # r.text ya estaría descomprimido y no permitiría ver la compresión real.
+        inicio = time.perf_counter()
+        r = self.session.get(url, headers={"Accept-Encoding": codificacion}, stream=True)
+        crudo = r.raw.read(decode_content=False)
+        tiempo_descarga = time.perf_counter() - inicio
+        r.close()
+
+        content_encoding = r.headers.get("Content-Encoding", "identity").strip().lower()
+        inicio = time.perf_counter()
+        decodificado = decodificar(crudo, content_encoding)
+        tiempo_decodificacion = time.perf_counter() - inicio
+
+        return {
+            "url": url,
+            "accept_encoding": codificacion,
+            "content_encoding": content_encoding,
+            "status": r.status_code,
+            "bytes_red": len(crudo),  # Cuerpo en la red (sin cabeceras).
+            "bytes_decodificados": len(decodificado) if decodificado is not None else None,
+            "tiempo_descarga_ms": round(tiempo_descarga * 1000, 2),
+            "tiempo_decodificacion_ms": round(tiempo_decodificacion * 1000, 3),
+        }
+
+    # ----------------------------------------------------------
+    # Caso 1: Bytes por página con cada Accept-Encoding
+    # ----------------------------------------------------------
+    def test_1_transferencia_por_codificacion(self):
+        for pagina, url in PAGINAS.items():
+            for codificacion in CODIFICACIONES:
+                with self.subTest(pagina=pagina, accept_encoding=codificacion):
+                    fila = {"pagina": pagina, **self.medir_transferencia(url, codificacion)}
+                    self.filas_red.append(fila)
+                    print(f"\n[{pagina} | Accept-Encoding: {codificacion}]")
+                    print("Status:", fila["status"], "| Content-Encoding:", fila["content_encoding"])
+                    print("Bytes red:", fila["bytes_red"], "| Bytes decodificados:", fila["bytes_decodificados"])
+
+                    # Verifica que la página responda y tenga contenido.
+                    self.assertEqual(fila["status"], 200)
+                    self.assertGreater(fila["bytes_red"], 0, f"La página '{pagina}' llegó vacía.")
+
+                    # Si se pidió compresión y el servidor respondió sin comprimir, se emite una advertencia.
+                    if codificacion != "identity" and fila["content_encoding"] == "identity":
+                        print(f"Advertencia: '{pagina}' se sirvió sin comprimir ({fila['bytes_red']} bytes).")
+
+    # ----------------------------------------------------------
+    # Caso 2: Peso de sub-recursos visto por Chrome (DevTools Network)
+    # ----------------------------------------------------------
+    def test_2_peso_subrecursos_chrome(self):
+        driver = crear_navegador()
+        try:
+            iniciar_sesion_navegador(driver)
+            for pagina, url in PAGINAS.items():
+                leer_eventos_red(driver)  # Descarta los eventos de la navegación anterior.
+                driver.get(url)
+                resumen = peso_recursos(leer_eventos_red(driver))
+
+                print(f"\n[Sub-recursos – {pagina}]")
+                for tipo, datos in sorted(resumen.items()):
+                    print(f"{tipo}: {datos['recursos']} recursos, {datos['bytes_red']} bytes red, "
+                          f"{datos['bytes_decodificados']} bytes decodificados")
+                    self.filas_chrome.append({"pagina": pagina, "tipo": tipo, **datos})
+
+                # Verifica que Chrome haya registrado al menos el documento principal.
+                self.assertIn("Document", resumen, f"No se registró el documento de '{pagina}'.")
+        finally:
+            driver.quit()  # Cierra el navegador aunque falle alguna verificación.
+
+    @classmethod
+    def tearDownClass(cls):
+        # Guarda el reporte de la ejecución en resultados/<ID_EJECUCION>/transferencia/.
+        carpeta = carpeta_resultados("transferencia")
+        with open(os.path.join(carpeta, "reporte.json"), "w", encoding="utf-8") as archivo:
+            json.dump({"red": cls.filas_red, "chrome": cls.filas_chrome}, archivo, indent=2)
+        for nombre, filas in (("red.csv", cls.filas_red), ("chrome.csv", cls.filas_chrome)):
+            if filas:
+                with open(os.path.join(carpeta, nombre), "w", newline="", encoding="utf-8") as archivo:
+                    escritor = csv.DictWriter(archivo, fieldnames=list(filas[0].keys()))
+                    escritor.writeheader()
+                    escritor.writerows(filas)
+        print(f"\nReporte guardado en: {carpeta}")
+        print("\n=== AUDITORIA DE TRANSFERENCIA Y COMPRESION FINALIZADA ===\n")
+
+# Ejecuta las pruebas cuando el script es ejecutado directamente.
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+import argparse  # Importa argparse para leer los parámetros de la línea de comandos.
+import ast  # Importa ast para encontrar las clases de prueba sin importar los módulos.
+import contextlib  # Importa contextlib para capturar la salida de cada clase.
+import hashlib  # Importa hashlib para dar un nombre único a cada módulo cargado.
+import importlib.util  # Importa importlib para cargar archivos con espacios en la ruta.
+import io  # Importa io para capturar la salida en memoria.
+import json  # Importa json para guardar el reporte combinado.
+import multiprocessing  # Importa multiprocessing para numerar los trabajadores.
+import os  # Importa os para recorrer las carpetas y asignar variables de entorno.
+import sys  # Importa sys para el código de salida.
+import time  # Importa time para medir la duración de cada clase.
+import traceback  # Importa traceback para reportar errores al cargar un módulo.
+import unittest  # Importa la librería para ejecutar las pruebas.
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed  # Importa los pools.
+from concurrent.futures.process import BrokenProcessPool  # Error de las tareas de un pool cuyo proceso se cayó.
+
+from utilidades import ejecucion  # Módulo con los identificadores de la ejecución y del trabajador.
+from utilidades.ejecucion import ID_EJECUCION, carpeta_resultados  # Identificador y carpeta de la ejecución.
+
+# Carpeta PRUEBAS/ (donde están las carpetas de los cuadrantes).
+CARPETA_PRUEBAS = os.path.dirname(os.path.abspath(__file__))
+
+# Carpetas que no contienen pruebas.
+CARPETAS_EXCLUIDAS = {"utilidades", "resultados", "__pycache__"}
+
+# --------------------------------------------------------------
+# Descubre las clases de prueba de todas las carpetas de cuadrantes
+# --------------------------------------------------------------
+def descubrir_clases(patron=None):
+    # Recorre PRUEBAS/ (las carpetas tienen espacios y prefijos numéricos, por eso no se usa
+    # unittest discover) y analiza cada test_*.py con ast, sin importarlo, para listar sus TestCase.
+    # También se incluyen las subclases de otras clases de prueba del mismo módulo (class TestB(TestA)).
+    clases = []
+    for raiz, carpetas, archivos in os.walk(CARPETA_PRUEBAS):
+        carpetas[:] = sorted(c for c in carpetas if c not in CARPETAS_EXCLUIDAS)
+        for archivo in sorted(archivos):
+            if not (archivo.startswith("test_") and archivo.endswith(".py")):
+                continue
+            ruta = os.path.join(raiz, archivo)
+            with open(ruta, encoding="utf-8") as f:
+                arbol = ast.parse(f.read(), filename=ruta)
+            bases_prueba = {"unittest.TestCase", "TestCase"}
+            for nodo in arbol.body:
+                if isinstance(nodo, ast.ClassDef) and any(ast.unparse(base) in bases_prueba for base in nodo.bases):
+                    bases_prueba.add(nodo.name)  # Sus subclases (definidas más abajo) también son pruebas.
+                    relativa = os.path.relpath(ruta, CARPETA_PRUEBAS)
+                    if patron is None or patron.lower() in f"{relativa}::{nodo.name}".lower():
+                        clases.append((ruta, nodo.name))
+    return clases
+
+# --------------------------------------------------------------
+# Inicialización de cada proceso del pool
+# --------------------------------------------------------------
+def iniciar_trabajador(contador):
+    # Cada proceso recibe su propio ID_TRABAJADOR, así los datos de prueba (FabricaUsuarios)
+    # no se repiten entre procesos. ID_EJECUCION se hereda del proceso principal.
+    with contador.get_lock():
+        contador.value += 1
+        os.environ["ID_TRABAJADOR"] = str(contador.value)
+        ejecucion.ID_TRABAJADOR = os.environ["ID_TRABAJADOR"]  # Por si el módulo ya estaba importado.
+
+# --------------------------------------------------------------
+# Fila de error de una clase cuyo proceso terminó de forma anormal
+# --------------------------------------------------------------
+def fila_caida(ruta, nombre_clase):
+    # Se llama dentro de un except: la traza es la del error del pool (p. ej. BrokenProcessPool).
+    traza = traceback.format_exc()
+    return {"archivo": os.path.relpath(ruta, CARPETA_PRUEBAS), "clase": nombre_clase, "trabajador": "-",
+            "segundos": 0.0, "ejecutadas": 0, "omitidas": 0, "fallos": [],
+            "errores": [(nombre_clase, traza)], "salida": traza}
+
+# --------------------------------------------------------------
+# Vuelve a ejecutar una clase en un pool propio de un solo proceso
+# --------------------------------------------------------------
+def ejecutar_aislada(ruta, nombre_clase, contador):
+    # Cuando un proceso del pool se cae, todas las clases pendientes fallan con BrokenProcessPool y no se
+    # sabe cuál lo provocó. Cada una se repite sola: si vuelve a caerse, el error es de esa clase.
+    try:
+        with ProcessPoolExecutor(max_workers=1, initializer=iniciar_trabajador, initargs=(contador,)) as ejecutor:
+            fila = ejecutor.submit(ejecutar_clase, ruta, nombre_clase).result()
+    except Exception:
+        fila = fila_caida(ruta, nombre_clase)
+    fila["reintentada"] = True
+    return fila
+
+# --------------------------------------------------------------
+# Muestra el resultado de una clase
+# --------------------------------------------------------------
+def mostrar_fila(fila, mostrar_salida):
+    estado = "FALLO" if fila["fallos"] or fila["errores"] else "OK"
+    reintento = " [reintentada]" if fila.get("reintentada") else ""
+    print(f"[{estado}] {fila['archivo']}::{fila['clase']} | {fila['ejecutadas']} pruebas, "
+          f"{fila['omitidas']} omitidas | {fila['segundos']}s (trabajador {fila['trabajador']}){reintento}")
+    if mostrar_salida or estado == "FALLO":
+        print(fila["salida"])
+
+# --------------------------------------------------------------
+# Ejecuta una clase de prueba dentro de un proceso del pool
+# --------------------------------------------------------------
+def ejecutar_clase(ruta, nombre_clase):
+    # El módulo se carga dentro del proceso, de modo que setUpClass (login, sesión, navegador)
+    # vive solo en este proceso y no comparte cookies con los demás.
+    nombre_modulo = "prueba_" + hashlib.sha1(ruta.encode("utf-8")).hexdigest()[:12]
+    salida = io.StringIO()
+    inicio = time.perf_counter()
+    with contextlib.redirect_stdout(salida), contextlib.redirect_stderr(salida):
+        try:
+            spec = importlib.util.spec_from_file_location(nombre_modulo, ruta)
+            modulo = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(modulo)
+            suite = unittest.defaultTestLoader.loadTestsFromTestCase(getattr(modulo, nombre_clase))
+            resultado = unittest.TextTestRunner(stream=salida, verbosity=2).run(suite)
+            fallos = [(str(prueba), traza) for prueba, traza in resultado.failures]
+            errores = [(str(prueba), traza) for prueba, traza in resultado.errors]
+            ejecutadas, omitidas = resultado.testsRun, len(resultado.skipped)
+        except Exception:  # Error al importar el módulo (p. ej. dependencia faltante).
+            traza = traceback.format_exc()
+            salida.write(traza)
+            fallos, errores, ejecutadas, omitidas = [], [(nombre_clase, traza)], 0, 0
+
+    return {
+        "archivo": os.path.relpath(ruta, CARPETA_PRUEBAS),
+        "clase": nombre_clase,
+        "trabajador": os.environ.get("ID_TRABAJADOR"),
+        "segundos": round(time.perf_counter() - inicio, 2),
+        "ejecutadas": ejecutadas,
+        "omitidas": omitidas,
+        "fallos": fallos,
+        "errores": errores,
+        "salida": salida.getvalue(),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ejecuta en paralelo las pruebas de todos los cuadrantes.")
+    parser.add_argument("--trabajadores", type=int, default=4, help="Procesos simultáneos.")
+    parser.add_argument("--patron", default=None, help="Solo clases cuyo archivo o nombre contenga este texto.")
+    parser.add_argument("--mostrar-salida", action="store_true", help="Muestra la salida completa de cada clase.")
+    args = parser.parse_args()
+
+    clases = descubrir_clases(args.patron)
+    print(f"\n=== EJECUCION {ID_EJECUCION}: {len(clases)} clases de prueba con {args.trabajadores} procesos ===\n")
+
+    # Los resultados se muestran a medida que cada clase termina.
+    resultados = []
+    interrumpidas = []  # Clases que no terminaron porque un proceso del pool se cayó.
+    inicio = time.perf_counter()
+    contador = multiprocessing.Value("i", 0)
+    with ProcessPoolExecutor(max_workers=args.trabajadores, initializer=iniciar_trabajador,
+                             initargs=(contador,)) as ejecutor:
+        futuros = {ejecutor.submit(ejecutar_clase, ruta, clase): (ruta, clase) for ruta, clase in clases}
+        for futuro in as_completed(futuros):
+            try:
+                fila = futuro.result()
+            except BrokenProcessPool:
+                # Un proceso terminó de forma anormal (p. ej. Chrome o el driver se cayó); la clase se repite al final.
+                interrumpidas.append(futuros[futuro])
+                continue
+            except Exception:
+                # Cualquier otro error del pool se registra como error de la clase y el reporte se escribe igual.
+                fila = fila_caida(*futuros[futuro])
+            resultados.append(fila)
+            mostrar_fila(fila, args.mostrar_salida)
+
+    # Las clases interrumpidas se repiten, cada una en su propio proceso (hasta --trabajadores a la vez).
+    if interrumpidas:
+        print(f"\nUn proceso terminó de forma anormal: se repiten {len(interrumpidas)} clases por separado.\n")
+        with ThreadPoolExecutor(max_workers=args.trabajadores) as hilos:
+            futuros = [hilos.submit(ejecutar_aislada, ruta, clase, contador) for ruta, clase in interrumpidas]
+            for futuro in as_completed(futuros):
+                fila = futuro.result()
+                resultados.append(fila)
+                mostrar_fila(fila, args.mostrar_salida)
+
+    # Reporte combinado con el tiempo por clase.
+    total = round(time.perf_counter() - inicio, 2)
+    resultados.sort(key=lambda f: (f["archivo"], f["clase"]))
+    ruta_reporte = os.path.join(carpeta_resultados(), "reporte_pruebas.json")
+    with open(ruta_reporte, "w", encoding="utf-8") as archivo:
+        json.dump({"ejecucion": ID_EJECUCION, "segundos": total, "clases": resultados},
+                  archivo, indent=2, ensure_ascii=False)
+
+    fallidas = sum(len(f["fallos"]) + len(f["errores"]) for f in resultados)
+    print(f"\nPruebas: {sum(f['ejecutadas'] for f in resultados)} | Fallos/errores: {fallidas} | "
+          f"Tiempo total: {total}s")
+    print(f"Reporte: {ruta_reporte}")
+    sys.exit(1 if fallidas else 0)
@@ -0,0 +1,3 @@
+# Utilidades compartidas por las pruebas de Biblioteca CUBO (datos de prueba, resultados por ejecución, etc.).
+# Las carpetas de pruebas tienen espacios en el nombre, por lo que cada script agrega PRUEBAS/ al sys.path
+# antes de importar este paquete.
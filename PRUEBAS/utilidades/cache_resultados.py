@@ -0,0 +1,121 @@
+import hashlib  # Importa hashlib para calcular la huella de las respuestas.
+import json  # Importa json para guardar la caché entre ejecuciones.
+import os  # Importa os para leer variables de entorno y manejar rutas.
+import re  # Importa re para normalizar el contenido (tokens, fechas).
+import time  # Importa time para estimar el trabajo omitido.
+
+from utilidades.ejecucion import CARPETA_RESULTADOS  # La caché vive fuera de las carpetas por ejecución.
+
+# Modo incremental: reutiliza el resultado anterior si la respuesta no cambió (MODO_INCREMENTAL=1).
+MODO_INCREMENTAL = os.environ.get("MODO_INCREMENTAL") == "1"
+
+# Carpeta donde se guarda la caché (compartida entre ejecuciones). Cada módulo de pruebas usa su
+# propio archivo, así dos clases que terminan al mismo tiempo en procesos distintos no se pisan.
+CARPETA_CACHE = os.path.join(CARPETA_RESULTADOS, "cache")
+
+# Partes del HTML que cambian en cada solicitud sin que cambie la página (se trabaja sobre bytes,
+# para no decodificar ni parsear el HTML). Cada patrón tiene su reemplazo.
+PATRONES_VOLATILES = [
+    (re.compile(rb'<input[^>]*name="_token"[^>]*>'), b""),  # Campo oculto con el token CSRF.
+    (re.compile(rb'<meta[^>]*name="csrf-token"[^>]*>'), b""),  # Token CSRF en la cabecera.
+    (re.compile(rb'nonce="[^"]*"'), b""),  # Nonces de scripts.
+    (re.compile(rb'\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}(:\d{2})?(\.\d+)?(Z|[+-]\d{2}:?\d{2})?'), b""),  # Fechas y horas.
+    # Parámetros anti-caché, solo en src/href de archivos .css y .js (otros ?id= sí son contenido).
+    (re.compile(rb'((?:src|href)="[^"?]*\.(?:css|js))\?[^"]*"'), rb'\1"'),
+]
+
+# --------------------------------------------------------------
+# Huella de una respuesta: status + hash del contenido normalizado
+# --------------------------------------------------------------
+def huella_respuesta(r):
+    contenido = r.content
+    for patron, reemplazo in PATRONES_VOLATILES:
+        contenido = patron.sub(reemplazo, contenido)
+    return f"{r.status_code}:{hashlib.sha256(contenido).hexdigest()}"
+
+# --------------------------------------------------------------
+# Huella de las verificaciones (si cambian las aserciones, se invalida la caché)
+# --------------------------------------------------------------
+def huella_verificaciones(verificaciones):
+    def bytes_codigo(codigo):
+        # Incluye el bytecode y las constantes; los generadores internos se recorren en lugar de usar su
+        # repr (que contiene la dirección de memoria y cambiaría en cada ejecución).
+        partes = [codigo.co_code, repr(codigo.co_names).encode("utf-8")]
+        for constante in codigo.co_consts:
+            if hasattr(constante, "co_code"):
+                partes.append(bytes_codigo(constante))
+            else:
+                partes.append(repr(constante).encode("utf-8"))
+        return b"\x00".join(partes)
+
+    return hashlib.sha256(bytes_codigo(verificaciones.__code__)).hexdigest()[:16]
+
+
+class CacheResultados:
+    # Caché de resultados de pruebas de solo lectura. La solicitud siempre se hace; solo se omiten
+    # el parseo y las aserciones cuando la huella de la respuesta coincide con la de la ejecución anterior.
+
+    def __init__(self, nombre, activo=MODO_INCREMENTAL):
+        self.activo = activo  # Si es False, las verificaciones siempre se ejecutan.
+        self.ruta = os.path.join(CARPETA_CACHE, f"{nombre}.json")  # Archivo de la caché de este módulo.
+        self.datos = {}  # Clase.método de la prueba -> resultado anterior.
+        self.nuevos = {}  # Resultados de esta ejecución (se guardan al final).
+        self.reutilizadas = 0  # Verificaciones omitidas.
+        self.ejecutadas = 0  # Verificaciones ejecutadas.
+        self.segundos_omitidos = 0.0  # Tiempo de verificación ahorrado (según la última ejecución real).
+        if self.activo and os.path.exists(self.ruta):
+            with open(self.ruta, encoding="utf-8") as archivo:
+                self.datos = json.load(archivo)
+
+    # --------------------------------------------------------------
+    # Ejecuta las verificaciones o reutiliza el resultado anterior
+    # --------------------------------------------------------------
+    def verificar(self, prueba, respuesta, verificaciones):
+        # 'prueba' es el TestCase, 'respuesta' la respuesta ya descargada y 'verificaciones'
+        # una función que recibe la respuesta y hace las aserciones.
+        if not self.activo:
+            verificaciones(respuesta)
+            return
+
+        # Clave sin el nombre del módulo (que es __main__ o prueba_<hash> según cómo se ejecute).
+        clave = f"{type(prueba).__name__}.{prueba._testMethodName}"
+        huella = f"{huella_respuesta(respuesta)}:{huella_verificaciones(verificaciones)}"
+        anterior = self.datos.get(clave)
+        if anterior and anterior["huella"] == huella:
+            self.reutilizadas += 1
+            self.segundos_omitidos += anterior["segundos"]
+            print("(Resultado reutilizado: la respuesta no cambió desde la ejecución anterior)")
+            if anterior["fallo"]:
+                prueba.fail(f"{anterior['fallo']} (resultado en caché)")
+            return
+
+        self.ejecutadas += 1
+        inicio = time.perf_counter()
+        try:
+            verificaciones(respuesta)
+        except AssertionError as error:
+            self.nuevos[clave] = {"huella": huella, "fallo": str(error), "segundos": time.perf_counter() - inicio}
+            raise
+        self.nuevos[clave] = {"huella": huella, "fallo": None, "segundos": time.perf_counter() - inicio}
+
+    # --------------------------------------------------------------
+    # Guarda la caché y muestra cuánto trabajo se omitió
+    # --------------------------------------------------------------
+    def guardar(self):
+        if not self.activo:
+            return
+        # Se vuelve a leer el archivo antes de escribir (por si el mismo módulo se ejecutó en otra corrida).
+        datos = {}
+        if os.path.exists(self.ruta):
+            with open(self.ruta, encoding="utf-8") as archivo:
+                datos = json.load(archivo)
+        datos.update(self.nuevos)
+        os.makedirs(os.path.dirname(self.ruta), exist_ok=True)
+        temporal = f"{self.ruta}.{os.getpid()}.tmp"
+        with open(temporal, "w", encoding="utf-8") as archivo:
+            json.dump(datos, archivo, indent=2)
+        os.replace(temporal, self.ruta)  # Reemplazo atómico del archivo.
+
+        total = self.reutilizadas + self.ejecutadas
+        print(f"\n[Modo incremental] Verificaciones reutilizadas: {self.reutilizadas}/{total} | "
+              f"Tiempo omitido: {round(self.segundos_omitidos * 1000, 1)} ms")
@@ -0,0 +1,187 @@
+import argparse  # Importa argparse para leer los parámetros de la línea de comandos.
+import hashlib  # Importa hashlib para generar usernames cortos a partir de la clave del usuario.
+import itertools  # Importa itertools para recorrer los usuarios en lotes sin cargarlos todos en memoria.
+import json  # Importa json para guardar los usuarios generados (un JSON por línea).
+import os  # Importa os para manejar rutas de archivos.
+import random  # Importa random para generar datos reproducibles a partir de una semilla.
+from concurrent.futures import ThreadPoolExecutor  # Importa el pool de hilos para registrar usuarios en paralelo.
+
+import requests  # Importa la librería para hacer solicitudes HTTP.
+from bs4 import BeautifulSoup  # Importa BeautifulSoup para parsear y manipular HTML.
+
+from utilidades.ejecucion import ID_EJECUCION, ID_TRABAJADOR, base36, carpeta_resultados, reparar_jsonl
+
+# URL base del formulario de registro de usuarios
+REGISTER_URL = "https://biblioteca-cubo.com/Biblioteca-CUBO/public/user/registerUser"
+
+# Tiempo máximo de espera por solicitud durante el pre-aprovisionamiento (segundos).
+TIMEOUT = 30
+
+# Longitud máxima del username generado: 4 caracteres del prefijo + 12 del hash de la clave.
+LARGO_PREFIJO_USERNAME = 4
+LARGO_HASH_USERNAME = 12  # 12 dígitos base 36 (60 bits): colisiones despreciables aun con millones de usuarios.
+LARGO_MAXIMO_USERNAME = LARGO_PREFIJO_USERNAME + LARGO_HASH_USERNAME  # 16, igual que los datos fijos originales.
+
+# Valores posibles para los datos no identificativos del usuario.
+NOMBRES = ["Jesse", "Ana", "Carlos", "María", "José", "Lucía", "Mario", "Sofía", "Luis", "Elena"]
+APELLIDOS = ["Miranda", "Pérez", "García", "López", "Martínez", "Hernández", "Ramírez", "Flores"]
+SEXOS = ["Masculino", "Femenino"]
+DIRECCIONES = ["San Miguel", "Barrio La Cruz, Calle Principal", "Colonia Ciudad Jardín", "Barrio El Centro"]
+
+# Contador de fábricas por prefijo en este proceso. Cada fábrica recibe su propio espacio de nombres,
+# así dos clases con el mismo prefijo que corren en el mismo trabajador no generan los mismos usuarios.
+_ESPACIOS = {}
+
+
+class FabricaUsuarios:
+    # Genera usuarios de prueba únicos y reproducibles a partir de una semilla.
+    # La unicidad no depende del azar: el correo se construye con el identificador de la ejecución,
+    # el del trabajador, el espacio de la fábrica y un índice consecutivo, por lo que no hay colisiones
+    # aunque se generen millones de usuarios. El username es un hash corto de esa misma clave
+    # (máximo LARGO_MAXIMO_USERNAME caracteres). El azar (con semilla) solo se usa para el resto de campos,
+    # y no depende de la ejecución: la misma semilla (y el mismo trabajador) reproduce los mismos datos.
+
+    def __init__(self, prefijo="usuario_test", semilla=0, ejecucion=None, trabajador=None, password="12345678",
+                 espacio=None):
+        self.prefijo = prefijo  # Prefijo del correo y del username (identifica el tipo de prueba).
+        self.semilla = semilla  # Semilla para reproducir los mismos datos en otra corrida.
+        self.ejecucion = ejecucion or ID_EJECUCION  # Espacio de nombres de la ejecución.
+        self.trabajador = str(trabajador if trabajador is not None else ID_TRABAJADOR)  # Espacio de nombres del trabajador.
+        self.password = password  # Contraseña común de los usuarios generados.
+        # Espacio de nombres de la fábrica: 0 para la primera fábrica de este prefijo en el proceso, 1 para la segunda...
+        self.espacio = espacio if espacio is not None else next(_ESPACIOS.setdefault(prefijo, itertools.count()))
+        self.indice = 0  # Índice del siguiente usuario a generar.
+
+    # --------------------------------------------------------------
+    # Genera el usuario número 'indice' (siempre el mismo para la misma semilla)
+    # --------------------------------------------------------------
+    def usuario(self, indice):
+        # Generador aleatorio propio de este índice, para poder reproducir cualquier usuario por separado.
+        rnd = random.Random(f"{self.semilla}:{self.trabajador}:{indice}")
+
+        # Clave única del usuario: ejecución + trabajador + espacio de la fábrica + índice.
+        clave = f"{self.ejecucion}_{self.trabajador}_{base36(self.espacio)}_{base36(indice)}"
+        # El username se acorta con un hash de la clave, para no superar el largo de los datos originales.
+        numero = int.from_bytes(hashlib.blake2b(clave.encode("utf-8"), digest_size=8).digest(), "big") >> 4
+        clave_username = base36(numero).zfill(LARGO_HASH_USERNAME)
+        prefijo_username = self.prefijo.replace("_", "")[:LARGO_PREFIJO_USERNAME]
+
+        return {
+            "nombre": f"{rnd.choice(NOMBRES)} {rnd.choice(APELLIDOS)}",  # Nombre completo.
+            "edad": str(rnd.randint(18, 70)),  # Edad del usuario.
+            "sexo": rnd.choice(SEXOS),  # Sexo del usuario.
+            "correo": f"{self.prefijo}_{clave}@example.com",  # Correo único.
+            "username": f"{prefijo_username}{clave_username}",  # Nombre de usuario único (máx. 16 caracteres).
+            "telefono": f"7{rnd.randint(0, 9999999):07d}",  # Teléfono de 8 dígitos.
+            "direccion": rnd.choice(DIRECCIONES),  # Dirección del usuario.
+            "password": self.password,  # Contraseña.
+        }
+
+    # --------------------------------------------------------------
+    # Genera el siguiente usuario de la secuencia
+    # --------------------------------------------------------------
+    def siguiente(self):
+        usuario = self.usuario(self.indice)
+        self.indice += 1  # Avanza al siguiente índice.
+        return usuario
+
+    # --------------------------------------------------------------
+    # Genera 'cantidad' usuarios de forma perezosa (sin guardarlos en memoria)
+    # --------------------------------------------------------------
+    def usuarios(self, cantidad, inicio=0):
+        for indice in range(inicio, inicio + cantidad):
+            yield self.usuario(indice)
+
+    # --------------------------------------------------------------
+    # Crea el payload del formulario de registro para un usuario
+    # --------------------------------------------------------------
+    @staticmethod
+    def payload_registro(usuario, token, **cambios):
+        # Agrega el token CSRF y la confirmación de contraseña; 'cambios' permite forzar errores de validación.
+        payload = {"_token": token, **usuario, "password_confirmation": usuario["password"]}
+        payload.update(cambios)
+        return payload
+
+
+# --------------------------------------------------------------
+# Registra un usuario en el sistema con una sesión propia
+# --------------------------------------------------------------
+def registrar_usuario(usuario):
+    # Retorna (status, resultado), con resultado "registrado", "rechazado" o "error:<excepción>".
+    # Cada usuario usa su propia sesión, porque el registro deja la sesión iniciada.
+    try:
+        with requests.Session() as session:
+            r = session.get(REGISTER_URL, timeout=TIMEOUT)  # Obtiene el formulario de registro.
+            soup = BeautifulSoup(r.text, "html.parser")  # Analiza el HTML de la página.
+            token_tag = soup.find("input", {"name": "_token"})  # Busca el campo del token CSRF.
+            token = token_tag["value"] if token_tag else None  # Obtiene el valor del token CSRF.
+
+            r = session.post(REGISTER_URL, data=FabricaUsuarios.payload_registro(usuario, token),
+                             allow_redirects=True, timeout=TIMEOUT)
+    except requests.RequestException as error:
+        return None, f"error:{type(error).__name__}"  # El error de un usuario no detiene la corrida.
+
+    # Un registro fallido también responde 200 (redirige de vuelta al formulario con errores), así que
+    # el éxito se confirma con la URL final y las marcas de sesión iniciada de test_registro_exitoso.
+    texto = r.text.lower()
+    exito = (r.status_code == 200 and "registeruser" not in r.url.lower()
+             and any(x in texto for x in ["perfil", "cerrar sesión"]))
+    return r.status_code, "registrado" if exito else "rechazado"
+
+
+# --------------------------------------------------------------
+# Pre-aprovisiona usuarios antes de una prueba de carga
+# --------------------------------------------------------------
+def preaprovisionar(fabrica, cantidad, ruta_salida, hilos=8, registrar=True):
+    # Genera 'cantidad' usuarios, los registra (opcional) y los escribe a medida que avanzan en
+    # 'ruta_salida' (un JSON por línea). Así la prueba de carga puede omitir el registro en la ventana medida.
+    # Si el archivo ya existe (corrida interrumpida, mismo ID_EJECUCION), se continúa desde el último
+    # usuario escrito en lugar de sobrescribirlo. Retorna el número de usuarios registrados en esta llamada.
+    existentes = reparar_jsonl(ruta_salida)
+    registrados = 0
+    with open(ruta_salida, "a", encoding="utf-8") as archivo, ThreadPoolExecutor(max_workers=hilos) as ejecutor:
+        usuarios = fabrica.usuarios(max(0, cantidad - existentes), inicio=existentes)
+        while True:
+            lote = list(itertools.islice(usuarios, hilos * 4))  # Solo se mantiene un lote pequeño en memoria.
+            if not lote:
+                break
+            estados = ejecutor.map(registrar_usuario, lote) if registrar else [(None, "sin_registro")] * len(lote)
+            for usuario, (status, resultado) in zip(lote, estados):
+                usuario["registrado"] = resultado == "registrado"
+                usuario["resultado"] = resultado
+                usuario["status"] = status
+                registrados += usuario["registrado"]
+                archivo.write(json.dumps(usuario, ensure_ascii=False) + "\n")
+            archivo.flush()  # Deja el progreso en disco por si la corrida se interrumpe.
+    return registrados
+
+
+# --------------------------------------------------------------
+# Lee los usuarios pre-aprovisionados desde el archivo
+# --------------------------------------------------------------
+def leer_usuarios(ruta, solo_registrados=True):
+    # Recorre el archivo línea por línea (sirve para archivos con millones de usuarios).
+    with open(ruta, encoding="utf-8") as archivo:
+        for linea in archivo:
+            usuario = json.loads(linea)
+            if usuario.get("registrado") or not solo_registrados:
+                yield usuario
+
+
+# Permite pre-aprovisionar usuarios desde la terminal:
+#   cd PRUEBAS && python -m utilidades.datos_prueba --cantidad 10000 --hilos 16
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Genera y registra usuarios de prueba para Biblioteca CUBO.")
+    parser.add_argument("--cantidad", type=int, default=100, help="Número de usuarios a generar.")
+    parser.add_argument("--semilla", type=int, default=0, help="Semilla para reproducir los datos.")
+    parser.add_argument("--prefijo", default="carga", help="Prefijo del correo y del username.")
+    parser.add_argument("--hilos", type=int, default=8, help="Registros simultáneos.")
+    parser.add_argument("--salida", default=None, help="Archivo de salida (JSON por línea).")
+    parser.add_argument("--sin-registro", action="store_true", help="Solo genera el archivo, sin registrar.")
+    args = parser.parse_args()
+
+    salida = args.salida or os.path.join(carpeta_resultados(), f"usuarios_{ID_TRABAJADOR}.jsonl")
+    print(f"ID_EJECUCION: {ID_EJECUCION} (usar el mismo valor para reanudar)")
+    fabrica = FabricaUsuarios(prefijo=args.prefijo, semilla=args.semilla)
+    total = preaprovisionar(fabrica, args.cantidad, salida, hilos=args.hilos, registrar=not args.sin_registro)
+    print(f"Usuarios generados: {args.cantidad} | Registrados: {total} | Archivo: {salida}")
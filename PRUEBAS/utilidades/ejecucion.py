@@ -0,0 +1,63 @@
+import os  # Importa os para leer variables de entorno y manejar rutas.
+import random  # Importa random para agregar bits aleatorios al identificador de la ejecución.
+import time  # Importa time para generar el identificador de la ejecución.
+
+# Carpeta raíz donde se guardan los resultados de cada ejecución (PRUEBAS/resultados).
+CARPETA_RESULTADOS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "resultados")
+
+# --------------------------------------------------------------
+# Utilidad: convertir un entero a base 36 (identificadores cortos)
+# --------------------------------------------------------------
+def base36(numero):
+    # Convierte un entero no negativo a texto en base 36 (0-9, a-z).
+    digitos = "0123456789abcdefghijklmnopqrstuvwxyz"
+    if numero == 0:
+        return "0"
+    texto = ""
+    while numero:
+        numero, resto = divmod(numero, 36)  # Obtiene el siguiente dígito.
+        texto = digitos[resto] + texto
+    return texto
+
+# Identificador de la ejecución actual. Se puede fijar con la variable de entorno ID_EJECUCION
+# para que todos los procesos de una misma corrida compartan el mismo espacio de nombres.
+# Por defecto combina el segundo actual con 20 bits aleatorios (4 caracteres), para que dos corridas
+# iniciadas en el mismo segundo (p. ej. trabajos de CI en paralelo) no generen los mismos usuarios.
+ID_EJECUCION = os.environ.get("ID_EJECUCION") or (
+    base36(int(time.time())) + base36(random.SystemRandom().getrandbits(20)).zfill(4))
+os.environ.setdefault("ID_EJECUCION", ID_EJECUCION)  # Los procesos hijos heredan el mismo identificador.
+
+# Identificador del trabajador (proceso) actual dentro de la ejecución.
+ID_TRABAJADOR = os.environ.get("ID_TRABAJADOR", "0")
+
+# --------------------------------------------------------------
+# Utilidad: carpeta de resultados de la ejecución actual
+# --------------------------------------------------------------
+def carpeta_resultados(*partes):
+    # Retorna (y crea si no existe) la carpeta resultados/<ID_EJECUCION>/<partes...>.
+    ruta = os.path.join(CARPETA_RESULTADOS, ID_EJECUCION, *partes)
+    os.makedirs(ruta, exist_ok=True)
+    return ruta
+
+# --------------------------------------------------------------
+# Utilidad: reparar un archivo JSON por línea antes de reanudar
+# --------------------------------------------------------------
+def reparar_jsonl(ruta):
+    # Si la corrida se interrumpió a mitad de una escritura, la última línea queda incompleta
+    # (sin salto de línea). Se recorta esa línea y se retorna el número de líneas completas.
+    # El archivo se lee por bloques, así sirve para archivos con millones de líneas.
+    if not os.path.exists(ruta):
+        return 0
+    lineas = 0
+    ultimo_salto = 0  # Posición justo después del último salto de línea.
+    posicion = 0
+    with open(ruta, "rb+") as archivo:
+        for bloque in iter(lambda: archivo.read(1 << 20), b""):
+            saltos = bloque.count(b"\n")
+            if saltos:
+                lineas += saltos
+                ultimo_salto = posicion + bloque.rfind(b"\n") + 1
+            posicion += len(bloque)
+        if ultimo_salto < posicion:
+            archivo.truncate(ultimo_salto)  # Descarta la línea incompleta.
+    return lineas
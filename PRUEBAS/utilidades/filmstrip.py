@@ -0,0 +1,152 @@
+import base64  # Importa base64 para decodificar las capturas de DevTools.
+import hashlib  # Importa hashlib para deduplicar cuadros idénticos.
+import io  # Importa io para abrir las capturas JPEG desde memoria.
+import json  # Importa json para guardar el resultado de cada página.
+import os  # Importa os para construir rutas.
+import time  # Importa time para tomar capturas a intervalos fijos.
+
+import numpy as np  # Importa NumPy para comparar los cuadros de forma vectorizada.
+from PIL import Image  # Importa Pillow para decodificar las capturas.
+from selenium.common.exceptions import WebDriverException  # Errores de scripts durante el cambio de documento.
+
+from utilidades.ejecucion import carpeta_resultados  # Carpeta de resultados de la ejecución actual.
+
+# Factor de reducción de los cuadros capturados y analizados (1920x1080 -> 480x270).
+REDUCCION = 4
+
+# Calidad JPEG de las capturas: cuadros pequeños que se toman dentro del intervalo de 100 ms
+# (una captura PNG completa de 1920x1080 tarda más que el intervalo).
+CALIDAD_JPEG = 60
+
+# Progreso a partir del cual la página se considera visualmente completa.
+UMBRAL_COMPLETO = 0.999
+
+# Tiempo de carga según el navegador (loadEventEnd - inicio de la navegación), en milisegundos.
+SCRIPT_TIEMPO_CARGA = """
+var nav = performance.getEntriesByType('navigation')[0];
+if (nav) { return nav.loadEventEnd - nav.startTime; }
+return performance.timing.loadEventEnd - performance.timing.navigationStart;
+"""
+
+# --------------------------------------------------------------
+# Captura reducida de la pantalla (DevTools Page.captureScreenshot)
+# --------------------------------------------------------------
+def capturar_cuadro(driver, ancho, alto):
+    # La reducción y la compresión JPEG las hace el navegador, así cada captura tarda pocos ms.
+    respuesta = driver.execute_cdp_cmd("Page.captureScreenshot", {
+        "format": "jpeg",
+        "quality": CALIDAD_JPEG,
+        "clip": {"x": 0, "y": 0, "width": ancho, "height": alto, "scale": 1 / REDUCCION},
+    })
+    return base64.b64decode(respuesta["data"])
+
+# --------------------------------------------------------------
+# Indica si el documento nuevo terminó de cargar
+# --------------------------------------------------------------
+def documento_cargado(driver):
+    try:
+        return driver.execute_script("return !window.__filmstripAnterior && document.readyState === 'complete';")
+    except WebDriverException:
+        return False  # El script coincidió con el cambio de documento; se reintenta en el siguiente cuadro.
+
+# --------------------------------------------------------------
+# Captura el filmstrip de una navegación
+# --------------------------------------------------------------
+def capturar_filmstrip(driver, url, intervalo=0.1, cuadros_estables=5, limite=20.0):
+    # Navega a 'url' sin bloquear (window.location) y toma una captura cada 'intervalo' segundos
+    # hasta que la página terminó de cargar y se mantiene igual durante 'cuadros_estables' capturas.
+    # Retorna la lista de cuadros (tiempo en segundos, JPEG) y el tiempo de carga del documento.
+    # El driver debe crearse con page_load_strategy = "none": con la estrategia normal, ChromeDriver
+    # espera el fin de la carga antes de cada comando (scripts y capturas), y todos los cuadros
+    # mostrarían la página ya terminada.
+    driver.get("about:blank")  # Punto de partida en blanco, como en la medición de Speed Index.
+    viewport = driver.execute_cdp_cmd("Page.getLayoutMetrics", {})["cssLayoutViewport"]
+    ancho, alto = viewport["clientWidth"], viewport["clientHeight"]
+    driver.execute_script("window.__filmstripAnterior = true; window.location.href = arguments[0];", url)
+    inicio = time.perf_counter()
+
+    cuadros = []
+    tiempo_carga = None
+    estables = 0
+    while True:
+        siguiente = time.perf_counter() + intervalo
+        t = time.perf_counter() - inicio
+        jpeg = capturar_cuadro(driver, ancho, alto)
+        estables = estables + 1 if cuadros and jpeg == cuadros[-1][1] else 0
+        cuadros.append((t, jpeg))
+
+        # El documento nuevo no tiene la marca del anterior; se espera a que termine de cargar.
+        if tiempo_carga is None and documento_cargado(driver):
+            tiempo_carga = time.perf_counter() - inicio
+        if (tiempo_carga is not None and estables >= cuadros_estables) or t > limite:
+            break
+        time.sleep(max(0.0, siguiente - time.perf_counter()))
+
+    tiempo_navegador = driver.execute_script(SCRIPT_TIEMPO_CARGA)
+    if tiempo_navegador and tiempo_navegador > 0:
+        return cuadros, tiempo_navegador / 1000
+    # Respaldo: si el evento load no terminó (límite alcanzado), se usa el tiempo observado.
+    return cuadros, tiempo_carga if tiempo_carga is not None else time.perf_counter() - inicio
+
+# --------------------------------------------------------------
+# Progreso visual de cada cuadro (diferencia de imagen vectorizada)
+# --------------------------------------------------------------
+def progreso_visual(imagenes):
+    # 'imagenes' es un arreglo (cuadros, alto, ancho, canales). El progreso de cada cuadro es
+    # 1 - distancia(cuadro, final) / distancia(inicial, final), con la distancia como suma de diferencias absolutas.
+    imagenes = imagenes.astype(np.int16)
+    distancias = np.abs(imagenes - imagenes[-1]).sum(axis=(1, 2, 3), dtype=np.int64)
+    if distancias[0] == 0:
+        return np.ones(len(imagenes))  # La página no cambió respecto del cuadro inicial.
+    return np.clip(1.0 - distancias / distancias[0], 0.0, 1.0)
+
+# --------------------------------------------------------------
+# Speed Index y tiempo visualmente completo
+# --------------------------------------------------------------
+def speed_index(tiempos_ms, progreso):
+    # Speed Index = integral de (1 - progreso) en el tiempo (ms). Cada cuadro se mantiene hasta el siguiente.
+    indice = float(np.sum(np.diff(tiempos_ms) * (1.0 - progreso[:-1])))
+
+    # Visualmente completo: primer cuadro a partir del cual todos superan el umbral.
+    incompletos = np.nonzero(progreso < UMBRAL_COMPLETO)[0]
+    posicion = incompletos[-1] + 1 if len(incompletos) else 0
+    return round(indice, 1), round(float(tiempos_ms[min(posicion, len(tiempos_ms) - 1)]), 1)
+
+# --------------------------------------------------------------
+# Analiza y guarda el filmstrip de una página
+# --------------------------------------------------------------
+def analizar_filmstrip(nombre, cuadros, tiempo_carga):
+    # Los cuadros (ya reducidos por el navegador) se guardan una sola vez por contenido (hash), en
+    # resultados/<ID_EJECUCION>/filmstrip/cuadros/<hash>.jpg; cada página guarda solo su lista de referencias.
+    carpeta = carpeta_resultados("filmstrip")
+    carpeta_cuadros = carpeta_resultados("filmstrip", "cuadros")
+
+    imagenes = {}  # hash -> arreglo reducido (cada cuadro distinto se decodifica una sola vez).
+    hashes = []
+    for _, jpeg in cuadros:
+        clave = hashlib.sha1(jpeg).hexdigest()
+        hashes.append(clave)
+        if clave not in imagenes:
+            imagenes[clave] = np.asarray(Image.open(io.BytesIO(jpeg)).convert("RGB"))
+            ruta = os.path.join(carpeta_cuadros, f"{clave}.jpg")
+            if not os.path.exists(ruta):
+                with open(ruta, "wb") as f:
+                    f.write(jpeg)
+
+    tiempos_ms = np.array([t * 1000 for t, _ in cuadros])
+    progreso = progreso_visual(np.stack([imagenes[clave] for clave in hashes]))
+    indice, completo_ms = speed_index(tiempos_ms, progreso)
+
+    resultado = {
+        "pagina": nombre,
+        "speed_index": indice,
+        "visualmente_completo_ms": completo_ms,
+        "tiempo_carga_ms": round(tiempo_carga * 1000, 1),
+        "cuadros": [
+            {"tiempo_ms": round(float(t), 1), "hash": clave, "progreso": round(float(p), 4)}
+            for t, clave, p in zip(tiempos_ms, hashes, progreso)
+        ],
+    }
+    with open(os.path.join(carpeta, f"{nombre}.json"), "w", encoding="utf-8") as f:
+        json.dump(resultado, f, indent=2)
+    return resultado
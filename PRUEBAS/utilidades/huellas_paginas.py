@@ -0,0 +1,103 @@
+import hashlib  # Importa hashlib para el hash de 64 bits de cada característica.
+import json  # Importa json para guardar el índice de huellas.
+import os  # Importa os para leer variables de entorno y buscar la ejecución anterior.
+from collections import Counter  # Importa Counter para contar las características de la página.
+
+from bs4 import BeautifulSoup  # Importa BeautifulSoup para recorrer la estructura del HTML.
+
+from utilidades.ejecucion import CARPETA_RESULTADOS, ID_EJECUCION, carpeta_resultados
+from utilidades.texto import limpiar_texto  # Normalización de texto compartida.
+
+BITS = 64  # Tamaño de la huella.
+TAMANO_SHINGLE = 3  # Palabras por shingle de texto.
+
+# Distancia de Hamming a partir de la cual se considera que la estructura de la página cambió.
+UMBRAL_CAMBIO = int(os.environ.get("UMBRAL_HUELLA", "8"))
+
+# --------------------------------------------------------------
+# Características de una página: rutas de etiquetas + shingles de texto
+# --------------------------------------------------------------
+def caracteristicas(html):
+    soup = BeautifulSoup(html, "html.parser")
+    conteo = Counter()
+
+    # Rutas de etiquetas (p. ej. "html/body/div/form/input"), que capturan la estructura.
+    for etiqueta in soup.find_all(True):
+        ruta = [etiqueta.name] + [padre.name for padre in etiqueta.parents if padre.name != "[document]"]
+        conteo["t:" + "/".join(reversed(ruta))] += 1
+
+    # Shingles del texto visible y de los textos de inputs/botones (como en la prueba de integración).
+    textos = [soup.get_text(" ", strip=True)]
+    textos += [i.get("placeholder", "") for i in soup.find_all("input")]
+    textos += [b.get_text(strip=True) for b in soup.find_all("button")]
+    palabras = limpiar_texto(" ".join(textos)).split()
+    for i in range(max(1, len(palabras) - TAMANO_SHINGLE + 1)):
+        conteo["s:" + " ".join(palabras[i:i + TAMANO_SHINGLE])] += 1
+    return conteo
+
+# --------------------------------------------------------------
+# Simhash de 64 bits de una página
+# --------------------------------------------------------------
+def simhash(html):
+    pesos = [0] * BITS
+    for caracteristica, peso in caracteristicas(html).items():
+        h = int.from_bytes(hashlib.blake2b(caracteristica.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(BITS):
+            pesos[bit] += peso if (h >> bit) & 1 else -peso
+    return sum(1 << bit for bit in range(BITS) if pesos[bit] > 0)
+
+# --------------------------------------------------------------
+# Distancia de Hamming entre dos huellas
+# --------------------------------------------------------------
+def distancia(a, b):
+    return bin(a ^ b).count("1")
+
+
+class IndiceHuellas:
+    # Índice de huellas de páginas (clave -> huella). Cada página se compara con su propia huella
+    # de la ejecución anterior, así que basta un diccionario por clave.
+
+    def __init__(self, huellas=None):
+        self.huellas = dict(huellas or {})  # clave de la página -> huella.
+
+    # --------------------------------------------------------------
+    # Agrega (o reemplaza) la huella de una página
+    # --------------------------------------------------------------
+    def agregar(self, clave, huella):
+        self.huellas[clave] = huella
+
+    # --------------------------------------------------------------
+    # Compara con otro índice (la ejecución anterior) por clave
+    # --------------------------------------------------------------
+    def cambios(self, anterior, umbral=UMBRAL_CAMBIO):
+        # Retorna las páginas cuya huella se alejó más de 'umbral' bits respecto de la ejecución anterior.
+        resultado = {}
+        for clave, huella in self.huellas.items():
+            if clave in anterior.huellas:
+                d = distancia(huella, anterior.huellas[clave])
+                if d > umbral:
+                    resultado[clave] = d
+        return resultado
+
+    # --------------------------------------------------------------
+    # Guardar y cargar (las huellas se guardan en hexadecimal)
+    # --------------------------------------------------------------
+    def guardar(self, nombre):
+        ruta = os.path.join(carpeta_resultados("huellas"), f"{nombre}.json")
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            json.dump({clave: f"{h:016x}" for clave, h in self.huellas.items()}, archivo, indent=0)
+        return ruta
+
+    @classmethod
+    def cargar_anterior(cls, nombre):
+        # Carga el índice 'nombre' de la ejecución más reciente distinta de la actual (vacío si no hay).
+        rutas = []
+        if os.path.isdir(CARPETA_RESULTADOS):
+            for ejecucion in os.listdir(CARPETA_RESULTADOS):
+                ruta = os.path.join(CARPETA_RESULTADOS, ejecucion, "huellas", f"{nombre}.json")
+                if ejecucion != ID_EJECUCION and os.path.exists(ruta):
+                    rutas.append(ruta)
+        if not rutas:
+            return cls()
+        with open(max(rutas, key=os.path.getmtime), encoding="utf-8") as archivo:
+            return cls({clave: int(h, 16) for clave, h in json.load(archivo).items()})
@@ -0,0 +1,58 @@
+import json  # Importa json para leer los mensajes de DevTools.
+from selenium import webdriver  # Importa Selenium para controlar el navegador.
+from selenium.webdriver.chrome.options import Options  # Importa las opciones para configurar el navegador.
+
+# --------------------------------------------------------------
+# Utilidad: crear el navegador headless con el registro de red de DevTools
+# --------------------------------------------------------------
+def crear_navegador():
+    # Misma configuración que las pruebas de usabilidad, con el log "performance" activado
+    # para recibir los eventos del dominio Network de DevTools.
+    options = Options()
+    options.add_argument("--headless=new")  # Ejecuta el navegador sin interfaz gráfica.
+    options.add_argument("--disable-gpu")  # Desactiva la aceleración de GPU (opcional).
+    options.add_argument("--window-size=1920,1080")  # Establece el tamaño de la ventana del navegador.
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})  # Activa los eventos de DevTools.
+
+    driver = webdriver.Chrome(options=options)
+    driver.implicitly_wait(10)  # Espera implícita de 10 segundos para encontrar los elementos.
+    return driver
+
+# --------------------------------------------------------------
+# Utilidad: leer los eventos del dominio Network de DevTools
+# --------------------------------------------------------------
+def leer_eventos_red(driver):
+    # Retorna (y vacía) los eventos Network.* acumulados desde la última lectura.
+    eventos = []
+    for entrada in driver.get_log("performance"):
+        mensaje = json.loads(entrada["message"])["message"]
+        if mensaje["method"].startswith("Network."):
+            eventos.append(mensaje)
+    return eventos
+
+# --------------------------------------------------------------
+# Utilidad: peso de los recursos de una navegación
+# --------------------------------------------------------------
+def peso_recursos(eventos):
+    # Agrupa por tipo de recurso (Document, Script, Stylesheet, Image...) los bytes transferidos
+    # (encodedDataLength, con cabeceras y compresión) y los bytes decodificados (dataLength).
+    tipos = {}  # requestId -> tipo de recurso.
+    transferidos = {}  # requestId -> bytes en la red.
+    decodificados = {}  # requestId -> bytes después de descomprimir.
+    for evento in eventos:
+        params = evento["params"]
+        if evento["method"] == "Network.responseReceived":
+            tipos[params["requestId"]] = params.get("type", "Other")
+        elif evento["method"] == "Network.dataReceived":
+            decodificados[params["requestId"]] = decodificados.get(params["requestId"], 0) + params["dataLength"]
+        elif evento["method"] == "Network.loadingFinished":
+            transferidos[params["requestId"]] = params["encodedDataLength"]
+
+    resumen = {}
+    for request_id, bytes_red in transferidos.items():
+        tipo = tipos.get(request_id, "Other")
+        fila = resumen.setdefault(tipo, {"recursos": 0, "bytes_red": 0, "bytes_decodificados": 0})
+        fila["recursos"] += 1
+        fila["bytes_red"] += int(bytes_red)
+        fila["bytes_decodificados"] += decodificados.get(request_id, 0)
+    return resumen
@@ -0,0 +1,133 @@
+import json  # Importa json para guardar los resultados por página.
+import os  # Importa os para construir rutas.
+import re  # Importa re para generar nombres de archivo a partir de la URL.
+from selenium.common.exceptions import WebDriverException  # Errores de Selenium durante una interacción.
+
+from utilidades.ejecucion import carpeta_resultados  # Carpeta de resultados de la ejecución actual.
+
+# Script que se inyecta antes de cargar cada documento para registrar las tareas largas (> 50 ms).
+SCRIPT_TAREAS_LARGAS = """
+window.__tareasLargas = [];
+try {
+    new PerformanceObserver(function (lista) {
+        lista.getEntries().forEach(function (e) {
+            window.__tareasLargas.push({inicio: e.startTime, duracion: e.duration});
+        });
+    }).observe({type: 'longtask', buffered: true});
+} catch (e) {}
+"""
+
+# Script que mide la complejidad del DOM (nodos, profundidad máxima, hojas de estilo y scripts).
+SCRIPT_DOM = """
+var maxProfundidad = 0;
+var pila = [[document.documentElement, 1]];
+while (pila.length) {
+    var actual = pila.pop();
+    if (actual[1] > maxProfundidad) { maxProfundidad = actual[1]; }
+    for (var i = 0; i < actual[0].children.length; i++) { pila.push([actual[0].children[i], actual[1] + 1]); }
+}
+return {
+    nodos_dom: document.getElementsByTagName('*').length,
+    profundidad_maxima: maxProfundidad,
+    hojas_de_estilo: document.styleSheets.length,
+    scripts: document.scripts.length,
+    tareas_largas: window.__tareasLargas || []
+};
+"""
+
+# Script asíncrono que hace clic en un botón (buscado por su texto) y mide hasta el siguiente cuadro pintado.
+# Solo se buscan elementos <button> (como en test_elementos_de_navegacion): un enlace <a> con el mismo
+# texto navegaría a otra página y descargaría el documento antes de obtener el resultado.
+SCRIPT_INTERACCION = """
+var texto = arguments[0];
+var listo = arguments[arguments.length - 1];
+var boton = Array.prototype.find.call(
+    document.querySelectorAll('button'),
+    function (b) { return b.textContent.toLowerCase().indexOf(texto) !== -1; }
+);
+if (!boton) { listo(null); return; }
+var inicio = performance.now();
+boton.click();
+requestAnimationFrame(function () { setTimeout(function () { listo(performance.now() - inicio); }, 0); });
+"""
+
+# Métricas del dominio Performance de DevTools que se guardan.
+METRICAS = ["Nodes", "LayoutCount", "RecalcStyleCount", "LayoutDuration", "RecalcStyleDuration",
+            "ScriptDuration", "TaskDuration", "JSHeapUsedSize"]
+
+# Métricas acumuladas desde que se activó el dominio Performance (las demás son valores actuales).
+CONTADORES = ["LayoutCount", "RecalcStyleCount", "LayoutDuration", "RecalcStyleDuration",
+              "ScriptDuration", "TaskDuration"]
+
+# Interacciones del lector de libros (texto del botón en minúsculas).
+INTERACCIONES_LECTOR = ["página siguiente", "modo noche", "justificar", "índice"]
+
+# --------------------------------------------------------------
+# Activa el perfilador en el navegador (una vez, antes de navegar)
+# --------------------------------------------------------------
+def activar_perfilador(driver):
+    driver.execute_cdp_cmd("Performance.enable", {})  # Activa el dominio Performance de DevTools.
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": SCRIPT_TAREAS_LARGAS})
+
+# --------------------------------------------------------------
+# Lee las métricas del dominio Performance
+# --------------------------------------------------------------
+def metricas_rendimiento(driver):
+    respuesta = driver.execute_cdp_cmd("Performance.getMetrics", {})
+    valores = {m["name"]: m["value"] for m in respuesta["metrics"]}
+    return {nombre: valores.get(nombre) for nombre in METRICAS}
+
+# --------------------------------------------------------------
+# Métricas de una navegación: diferencia respecto de las leídas justo antes de navegar
+# --------------------------------------------------------------
+def metricas_desde(driver, inicio):
+    actuales = metricas_rendimiento(driver)
+    for nombre in CONTADORES:
+        if inicio.get(nombre) is not None and actuales[nombre] is not None:
+            diferencia = actuales[nombre] - inicio[nombre]
+            # Si la navegación cambió de proceso, los contadores empiezan de cero y se usa el valor actual.
+            if diferencia >= 0:
+                actuales[nombre] = diferencia
+    return actuales
+
+# --------------------------------------------------------------
+# Mide el tiempo de cada interacción y los layouts/recálculos de estilo que provoca
+# --------------------------------------------------------------
+def medir_interacciones(driver, interacciones):
+    resultados = {}
+    for texto in interacciones:
+        try:
+            antes = metricas_rendimiento(driver)
+            tiempo = driver.execute_async_script(SCRIPT_INTERACCION, texto)
+            despues = metricas_rendimiento(driver)
+        except WebDriverException as error:
+            # Un error de la interacción (p. ej. el botón recargó la página) no debe hacer fallar la prueba.
+            print(f"Advertencia: no se pudo medir la interacción '{texto}': {error.__class__.__name__}")
+            resultados[texto] = {"tiempo_ms": None, "layouts": None, "recalculos_estilo": None}
+            continue
+        resultados[texto] = {
+            "tiempo_ms": round(tiempo, 2) if tiempo is not None else None,  # None si no existe el botón.
+            "layouts": despues["LayoutCount"] - antes["LayoutCount"],
+            "recalculos_estilo": despues["RecalcStyleCount"] - antes["RecalcStyleCount"],
+        }
+    return resultados
+
+# --------------------------------------------------------------
+# Perfila la página actual y guarda el resultado
+# --------------------------------------------------------------
+def perfilar_pagina(driver, nombre, interacciones=(), metricas_inicio=None):
+    # Se ejecuta después de navegar; guarda resultados/<ID_EJECUCION>/render/<nombre>.json.
+    # 'metricas_inicio' son las métricas leídas justo antes de navegar: sin ellas, los contadores
+    # incluirían todas las páginas cargadas desde que se activó el perfilador.
+    resultado = {"pagina": nombre, "url": driver.current_url}
+    resultado.update(driver.execute_script(SCRIPT_DOM))
+    resultado["tiempo_tareas_largas_ms"] = round(sum(t["duracion"] for t in resultado["tareas_largas"]), 2)
+    resultado["metricas"] = (metricas_desde(driver, metricas_inicio) if metricas_inicio
+                             else metricas_rendimiento(driver))
+    if interacciones:
+        resultado["interacciones"] = medir_interacciones(driver, interacciones)
+
+    archivo = re.sub(r"[^a-zA-Z0-9_-]+", "_", nombre) + ".json"
+    with open(os.path.join(carpeta_resultados("render"), archivo), "w", encoding="utf-8") as f:
+        json.dump(resultado, f, indent=2, ensure_ascii=False)
+    return resultado
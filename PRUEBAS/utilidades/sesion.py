@@ -0,0 +1,47 @@
+from bs4 import BeautifulSoup  # Importa BeautifulSoup para parsear y manipular HTML.
+from selenium.webdriver.common.by import By  # Importa la clase para buscar elementos por su localización.
+
+# URLs base del sistema
+BASE = "https://biblioteca-cubo.com/Biblioteca-CUBO/public"
+LOGIN_URL = f"{BASE}/user/loginUser"
+
+# Credenciales del usuario de prueba existente.
+EMAIL = "mp20049@ues.edu.sv"
+PASSWORD = "12345678"
+
+# Tiempo máximo de espera de cada solicitud del login (segundos).
+TIMEOUT = 30
+
+# --------------------------------------------------------------
+# Utilidad: obtener token CSRF
+# --------------------------------------------------------------
+def obtener_token(session, url, timeout=TIMEOUT):
+    # Obtiene el token CSRF del formulario de la URL indicada.
+    r = session.get(url, timeout=timeout)  # Realiza una solicitud GET a la URL proporcionada.
+    soup = BeautifulSoup(r.text, "html.parser")  # Analiza el HTML de la respuesta.
+    token_tag = soup.find("input", {"name": "_token"})  # Busca el campo del token CSRF.
+    return token_tag["value"] if token_tag else None  # Retorna el token si lo encuentra.
+
+# --------------------------------------------------------------
+# Utilidad: iniciar sesión con requests
+# --------------------------------------------------------------
+def iniciar_sesion(session, email=EMAIL, password=PASSWORD, timeout=TIMEOUT):
+    # Inicia sesión en la sesión de requests indicada y retorna la respuesta del login.
+    payload = {
+        "_token": obtener_token(session, LOGIN_URL, timeout),
+        "email": email,
+        "password": password,
+    }
+    resp = session.post(LOGIN_URL, data=payload, allow_redirects=True, timeout=timeout)
+    assert resp.status_code in [200, 302], "No se pudo iniciar sesión correctamente."
+    return resp
+
+# --------------------------------------------------------------
+# Utilidad: iniciar sesión con Selenium
+# --------------------------------------------------------------
+def iniciar_sesion_navegador(driver, email=EMAIL, password=PASSWORD):
+    # Inicia sesión llenando el formulario de login en el navegador.
+    driver.get(LOGIN_URL)
+    driver.find_element(By.NAME, "email").send_keys(email)
+    driver.find_element(By.NAME, "password").send_keys(password)
+    driver.find_element(By.CLASS_NAME, "login-btn").click()
@@ -0,0 +1,11 @@
+import unicodedata  # Importa unicodedata para normalizar y eliminar tildes.
+
+# --------------------------------------------------------------
+# Normaliza texto (minúsculas + sin tildes)
+# --------------------------------------------------------------
+def limpiar_texto(texto):
+    # Normaliza el texto a minúsculas y elimina las tildes.
+    texto = texto.lower()
+    texto = ''.join(c for c in unicodedata.normalize('NFD', texto)
+                    if unicodedata.category(c) != 'Mn')  # Elimina las marcas de acento (tildes).
+    return texto